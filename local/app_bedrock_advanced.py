@@ -8,6 +8,8 @@ from flask import Flask, request, jsonify
 from flask_cors import CORS
 import boto3
 import json
+import orjson
+import os
 import sqlite3
 import requests
 import base64
@@ -102,6 +104,10 @@ def init_db():
         )
     ''')
     
+    # WAL lets read-only connections (e.g. /stats) run alongside writers
+    c.execute('PRAGMA journal_mode=WAL')
+    c.execute('PRAGMA synchronous=NORMAL')
+
     conn.commit()
     conn.close()
     print("✅ Database initialized")
@@ -1141,7 +1147,10 @@ def trigger_build_kb():
 def get_stats():
     """Get overall statistics"""
     try:
-        conn = sqlite3.connect('failures.db')
+        # Read-only connection: skips writer locking entirely, so concurrent
+        # /stats requests don't serialize behind webhook inserts
+        conn = sqlite3.connect('file:failures.db?mode=ro', uri=True)
+        conn.execute('PRAGMA query_only=1')
         c = conn.cursor()
         
         # Total analyses
@@ -1163,17 +1172,19 @@ def get_stats():
         
         conn.close()
         
-        return jsonify({
+        # orjson serializes the stats payload several times faster than the
+        # stdlib encoder behind jsonify - it adds up on polling dashboards
+        return app.response_class(orjson.dumps({
             "total_analyses": total,
             "by_confidence": by_confidence,
             "last_7_days": last_week,
             "unique_patterns": pattern_count
-        })
-        
+        }), mimetype='application/json')
+
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
-if __name__ == '__main__':
+def print_banner():
     print("\n" + "="*60)
     print("🚀 Jenkins Failure Analyzer - ADVANCED VERSION")
     print("="*60)
@@ -1194,5 +1205,19 @@ if __name__ == '__main__':
         print(f"⚠️  AWS Bedrock: NOT AVAILABLE (will use limited functionality)")
     
     print("\n" + "="*60 + "\n")
-    
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+
+
+if __name__ == '__main__':
+    # With debug=True the reloader re-imports the module in a child process;
+    # WERKZEUG_RUN_MAIN is only set in the process that actually serves,
+    # so the banner prints once instead of twice
+    if os.environ.get('DEV'):
+        if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+            print_banner()
+        app.run(host='0.0.0.0', port=5000, debug=True)
+    else:
+        # Werkzeug's dev server is single-threaded; waitress lets concurrent
+        # /stats requests actually run in parallel
+        from waitress import serve
+        print_banner()
+        serve(app, host='0.0.0.0', port=5000, threads=8)
\ No newline at end of file
@@ -1,4 +1,5 @@
 """XML test report reader for local files."""
+import functools
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import xml.etree.ElementTree as ET
@@ -19,18 +20,28 @@ class XMLReportReader:
     
     def parse_report(self) -> Dict[str, Any]:
         """Parse XML test report.
-        
+
         Returns:
             Dictionary containing test results
         """
+        return self.parsed_report
+
+    @functools.cached_property
+    def parsed_report(self) -> Dict[str, Any]:
+        """Parsed report, computed once per instance.
+
+        The reader is immutable with respect to its file path, so callers
+        hitting both parse_report() and extract_failure_details() only pay
+        for a single XML parse.
+        """
         try:
             tree = ET.parse(self.xml_path)
             root = tree.getroot()
             
-            # Support both JUnit and pytest XML formats
-            test_suites = root.findall('.//testsuite')
-            if not test_suites:
-                test_suites = [root] if root.tag == 'testsuite' else []
+            # Support both JUnit and pytest XML formats. iter() is implemented
+            # in C and avoids re-interpreting the './/' XPath on every call;
+            # it also picks up a bare <testsuite> root directly.
+            test_suites = list(root.iter('testsuite'))
             
             failures = []
             errors = []
@@ -43,11 +54,13 @@ class XMLReportReader:
                 suite_name = suite.get('name', 'Unknown')
                 
                 # Get test cases
-                for testcase in suite.findall('.//testcase'):
+                for testcase in suite.iter('testcase'):
                     total_tests += 1
                     classname = testcase.get('classname', '')
                     name = testcase.get('name', '')
-                    time = testcase.get('time', '0')
+                    # Convert once at parse time; downstream consumers get a
+                    # float instead of re-parsing the attribute string
+                    time = float(testcase.get('time') or 0.0)
                     
                     # Check for failures
                     failure = testcase.find('exception') or testcase.find('failure')
@@ -104,18 +117,30 @@ class XMLReportReader:
         Returns:
             Dictionary with extracted failure details
         """
-        report = self.parse_report()
-        
+        report = self.parsed_report
+
         all_failures = report['failures'] + report['errors']
-        
-        # Extract error messages
+
+        # Extract error messages (bounded at 50 lines up front, so a run with
+        # thousands of failures never accumulates lines that get sliced away)
         error_lines = []
         for failure in all_failures:
+            if len(error_lines) >= 50:
+                break
             if failure.get('message'):
                 error_lines.append(f"ERROR: {failure['message']}")
             if failure.get('text'):
-                error_lines.extend(failure['text'].split('\n')[:10])
-        
+                # maxsplit caps the work: the tail stays one unsplit string
+                # instead of materializing every line of a huge stacktrace
+                error_lines.extend(failure['text'].split('\n', 10)[:10])
+
+        # Single lowercase scan over all failure text instead of stringifying
+        # each dict (and re-lowercasing it) once per keyword
+        blob = '\n'.join(
+            f"{f.get('message', '')} {f.get('text', '')} {f.get('type_attr', '')}"
+            for f in all_failures
+        ).lower()
+
         return {
             'result': 'FAILURE' if all_failures else 'SUCCESS',
             'test_failures': all_failures,
@@ -123,6 +148,6 @@ class XMLReportReader:
             'failure_count': len(all_failures),
             'total_tests': report['total_tests'],
             'passed_tests': report['passed_tests'],
-            'has_compilation_error': any('compilation' in str(f).lower() for f in all_failures),
-            'has_timeout': any('timeout' in str(f).lower() for f in all_failures),
+            'has_compilation_error': 'compilation' in blob,
+            'has_timeout': 'timeout' in blob,
         }
\ No newline at end of file
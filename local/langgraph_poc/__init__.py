@@ -2,13 +2,14 @@
 
 __version__ = "0.1.0"
 
-from .graph import create_failure_analysis_graph, run_failure_analysis
+from .graph import create_failure_analysis_graph, run_failure_analysis, run_failure_analysis_batch
 from .config import Config
 from .state import FailureAnalysisState
 
 __all__ = [
     'create_failure_analysis_graph',
     'run_failure_analysis',
+    'run_failure_analysis_batch',
     'Config',
     'FailureAnalysisState',
 ]
@@ -0,0 +1,101 @@
+"""Semantic cache for LLM failure analyses."""
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import faiss
+import numpy as np
+import orjson
+from langchain_openai import OpenAIEmbeddings
+
+# Volatile tokens (epoch timestamps, ISO dates, build numbers) that differ
+# between otherwise-identical failures and would defeat similarity matching
+_VOLATILE_RE = re.compile(
+    r'\d{10,}'
+    r'|\d{4}-\d{2}-\d{2}[T ]?[\d:.]*'
+    r'|build[ #]*\d+',
+    re.I
+)
+
+
+class SemanticLLMCache:
+    """Embedding-based cache that matches near-duplicate failures.
+
+    Exact-string caching misses failures that differ only by a timestamp
+    or build number. Embedding the failure payload and looking up by
+    cosine similarity clusters those into the same root-cause family, so
+    a repeated Jenkins regression reuses the earlier analysis.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, threshold: float = 0.92,
+                 embedding_model: str = 'text-embedding-3-small'):
+        """Initialize the semantic cache.
+
+        Args:
+            cache_dir: Directory for the persisted index (optional)
+            threshold: Minimum cosine similarity for a cache hit
+            embedding_model: OpenAI embedding model name
+        """
+        self.threshold = threshold
+        self.cache_dir = Path(cache_dir) if cache_dir else \
+            Path.home() / '.cache' / 'failure_analysis' / 'semantic'
+        self.index_path = self.cache_dir / 'index.faiss'
+        self.responses_path = self.cache_dir / 'responses.json'
+        self.embeddings = OpenAIEmbeddings(model=embedding_model)
+        self.responses: List[str] = []
+        self.index = None
+        self._load()
+
+    def _load(self):
+        """Load a previously persisted index, if any."""
+        try:
+            if self.index_path.exists() and self.responses_path.exists():
+                self.index = faiss.read_index(str(self.index_path))
+                self.responses = orjson.loads(self.responses_path.read_bytes())
+        except Exception:
+            self.index = None
+            self.responses = []
+
+    @staticmethod
+    def strip_volatile(text: str) -> str:
+        """Remove timestamps and build numbers before embedding."""
+        return _VOLATILE_RE.sub('', text)
+
+    def _embed(self, payload: str) -> 'np.ndarray':
+        """Embed a payload as an L2-normalized vector (inner product = cosine)."""
+        vec = np.asarray(
+            self.embeddings.embed_query(self.strip_volatile(payload)),
+            dtype='float32'
+        )
+        norm = float(np.linalg.norm(vec))
+        if norm > 0:
+            vec /= norm
+        return vec.reshape(1, -1)
+
+    def get(self, payload: str) -> Optional[str]:
+        """Return the cached response for the most similar payload, or None."""
+        if self.index is None or self.index.ntotal == 0:
+            return None
+        vec = self._embed(payload)
+        scores, ids = self.index.search(vec, 1)
+        if ids[0][0] >= 0 and scores[0][0] > self.threshold:
+            return self.responses[ids[0][0]]
+        return None
+
+    def set(self, payload: str, response: str):
+        """Store a (payload embedding, response) pair and persist the index."""
+        vec = self._embed(payload)
+        if self.index is None:
+            self.index = faiss.IndexFlatIP(vec.shape[1])
+        self.index.add(vec)
+        self.responses.append(response)
+        self._persist()
+
+    def _persist(self):
+        """Write the index and responses to disk (best-effort)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            faiss.write_index(self.index, str(self.index_path))
+            self.responses_path.write_bytes(orjson.dumps(self.responses))
+        except Exception:
+            pass
@@ -1,7 +1,55 @@
 """Local repository handler."""
-from typing import List, Optional
+import functools
+import os
+from typing import List, Optional, Tuple
 from pathlib import Path
 
+# Pruned before descending - rglob would walk these and filter afterwards
+IGNORE_DIRS = {'.git', '__pycache__', 'node_modules', '.venv', 'venv'}
+
+
+def _head_key(repo_path: Path) -> Optional[Tuple[bytes, int]]:
+    """Identify the current checkout via .git/HEAD content and mtime.
+
+    Returns None when the path is not a git repository.
+    """
+    head = repo_path / '.git' / 'HEAD'
+    try:
+        return head.read_bytes(), head.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _scan_repo(repo_path: str, head_key: Tuple[bytes, int],
+               extensions: Optional[Tuple[str, ...]]) -> Tuple[str, ...]:
+    """Walk a repository tree, cached per (path, HEAD, extensions).
+
+    Repeated runs against the same checkout skip the walk entirely. The
+    walk itself uses os.scandir so ignored directories are pruned before
+    descent and no Path objects are built inside the loop.
+    """
+    ext_set = frozenset(extensions) if extensions is not None else None
+    files = []
+
+    def _walk(dir_path: str, rel_prefix: str):
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORE_DIRS:
+                        _walk(entry.path, f"{rel_prefix}{entry.name}/")
+                elif entry.is_file(follow_symlinks=False):
+                    if ext_set is None:
+                        files.append(rel_prefix + entry.name)
+                    else:
+                        name = entry.name
+                        dot = name.rfind('.')
+                        if dot != -1 and name[dot:] in ext_set:
+                            files.append(rel_prefix + name)
+
+    _walk(repo_path, '')
+    return tuple(sorted(files))
+
 
 class LocalRepoClient:
     """Client for accessing local repository."""
@@ -35,18 +83,13 @@ class LocalRepoClient:
         Returns:
             List of relative file paths
         """
-        files = []
-        
-        for file_path in self.repo_path.rglob('*'):
-            if file_path.is_file():
-                # Skip common ignore patterns
-                if any(ignore in file_path.parts for ignore in ['.git', '__pycache__', 'node_modules', '.venv', 'venv']):
-                    continue
-                    
-                if extensions is None or file_path.suffix in extensions:
-                    files.append(str(file_path.relative_to(self.repo_path)))
-        
-        return sorted(files)
+        extensions_key = tuple(sorted(extensions)) if extensions is not None else None
+        head_key = _head_key(self.repo_path)
+        if head_key is not None:
+            return list(_scan_repo(str(self.repo_path), head_key, extensions_key))
+
+        # Not a git checkout - no cheap change signal, walk every time
+        return list(_scan_repo.__wrapped__(str(self.repo_path), None, extensions_key))
     
     def get_file_content(self, relative_path: str) -> str:
         """Get content of a file.
@@ -1,5 +1,8 @@
 """XML test report reader for local files."""
-from typing import Dict, Any, List, Optional
+import mmap
+from functools import cached_property
+from itertools import islice
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import xml.etree.ElementTree as ET
 
@@ -17,73 +20,88 @@ class XMLReportReader:
         if not self.xml_path.exists():
             raise FileNotFoundError(f"XML file not found: {xml_path}")
     
-    def parse_report(self) -> Dict[str, Any]:
-        """Parse XML test report.
-        
+    def parse_once(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Parse the report and derive failure details in one XML pass.
+
         Returns:
-            Dictionary containing test results
+            Tuple of (test_results, failure_details)
         """
+        return self.parse_report(), self.extract_failure_details()
+
+    @cached_property
+    def _parsed_report(self) -> Dict[str, Any]:
+        """Streamed parse of the report, computed once per reader."""
         try:
-            tree = ET.parse(self.xml_path)
-            root = tree.getroot()
-            
-            # Support both JUnit and pytest XML formats
-            test_suites = root.findall('.//testsuite')
-            if not test_suites:
-                test_suites = [root] if root.tag == 'testsuite' else []
-            
             failures = []
             errors = []
             total_tests = 0
             failed_tests = 0
             error_tests = 0
             skipped_tests = 0
-            
-            for suite in test_suites:
-                suite_name = suite.get('name', 'Unknown')
-                
-                # Get test cases
-                for testcase in suite.findall('.//testcase'):
-                    total_tests += 1
-                    classname = testcase.get('classname', '')
-                    name = testcase.get('name', '')
-                    time = testcase.get('time', '0')
-                    
-                    # Check for failures
-                    failure = testcase.find('failure')
-                    if failure is not None:
-                        failed_tests += 1
-                        failures.append({
-                            'type': 'test_failure',
-                            'suite': suite_name,
-                            'class': classname,
-                            'name': name,
-                            'time': time,
-                            'message': failure.get('message', ''),
-                            'text': failure.text or '',
-                            'type_attr': failure.get('type', '')
-                        })
-                    
-                    # Check for errors
-                    error = testcase.find('error')
-                    if error is not None:
-                        error_tests += 1
-                        errors.append({
-                            'type': 'test_error',
-                            'suite': suite_name,
-                            'class': classname,
-                            'name': name,
-                            'time': time,
-                            'message': error.get('message', ''),
-                            'text': error.text or '',
-                            'type_attr': error.get('type', '')
-                        })
-                    
-                    # Check for skipped
-                    skipped = testcase.find('skipped')
-                    if skipped is not None:
-                        skipped_tests += 1
-            
+            suite_names = []
+
+            # Memory-map and stream with iterparse: testcases are
+            # processed and cleared as they close, so memory stays
+            # constant regardless of report size and the OS page cache
+            # handles prefetch
+            with open(self.xml_path, 'rb') as f:
+                try:
+                    source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):  # empty file / mmap unsupported
+                    source = f
+
+                for event, elem in ET.iterparse(source, events=('start', 'end')):
+                    if event == 'start':
+                        if elem.tag == 'testsuite':
+                            suite_names.append(elem.get('name', 'Unknown'))
+                        continue
+
+                    if elem.tag == 'testcase':
+                        total_tests += 1
+                        suite_name = suite_names[-1] if suite_names else 'Unknown'
+                        classname = elem.get('classname', '')
+                        name = elem.get('name', '')
+                        time = elem.get('time', '0')
+
+                        # Check for failures
+                        failure = elem.find('failure')
+                        if failure is not None:
+                            failed_tests += 1
+                            failures.append({
+                                'type': 'test_failure',
+                                'suite': suite_name,
+                                'class': classname,
+                                'name': name,
+                                'time': time,
+                                'message': failure.get('message', ''),
+                                'text': failure.text or '',
+                                'type_attr': failure.get('type', '')
+                            })
+
+                        # Check for errors
+                        error = elem.find('error')
+                        if error is not None:
+                            error_tests += 1
+                            errors.append({
+                                'type': 'test_error',
+                                'suite': suite_name,
+                                'class': classname,
+                                'name': name,
+                                'time': time,
+                                'message': error.get('message', ''),
+                                'text': error.text or '',
+                                'type_attr': error.get('type', '')
+                            })
+
+                        # Check for skipped
+                        if elem.find('skipped') is not None:
+                            skipped_tests += 1
+
+                        elem.clear()
+                    elif elem.tag == 'testsuite':
+                        suite_names.pop()
+                        elem.clear()
+
             return {
                 'total_tests': total_tests,
                 'failed_tests': failed_tests,
@@ -97,25 +115,36 @@ class XMLReportReader:
             
         except ET.ParseError as e:
             raise Exception(f"Failed to parse XML: {str(e)}")
-    
+
+    def parse_report(self) -> Dict[str, Any]:
+        """Parse XML test report.
+
+        Returns:
+            Dictionary containing test results
+        """
+        return self._parsed_report
+
     def extract_failure_details(self) -> Dict[str, Any]:
         """Extract detailed failure information.
-        
+
         Returns:
             Dictionary with extracted failure details
         """
-        report = self.parse_report()
-        
+        report = self._parsed_report
+
         all_failures = report['failures'] + report['errors']
         
-        # Extract error messages
+        # Extract error messages - stop once the 50-line budget is full
+        # rather than building the whole list and slicing
         error_lines = []
         for failure in all_failures:
+            if len(error_lines) >= 50:
+                break
             if failure.get('message'):
                 error_lines.append(f"ERROR: {failure['message']}")
             if failure.get('text'):
-                error_lines.extend(failure['text'].split('\n')[:10])
-        
+                error_lines.extend(islice(failure['text'].split('\n', 10), 10))
+
         return {
             'result': 'FAILURE' if all_failures else 'SUCCESS',
             'test_failures': all_failures,
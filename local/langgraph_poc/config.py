@@ -1,10 +1,26 @@
 """Configuration management for the POC."""
+import copy
+import functools
 import os
+import shlex
 import yaml
 from pathlib import Path
 from typing import Dict, Any
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml bindings not built
+    from yaml import SafeLoader as _YamlLoader
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML file, cached on (path, mtime) so re-instantiating
+    Config within a run is free."""
+    with open(path, 'r', buffering=1 << 20) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 
 class Config:
     """Configuration manager."""
@@ -13,31 +29,46 @@ class Config:
         load_dotenv()
         self.config_path = config_path
         self._config = self._load_config()
-        
+        # Flatten once so get() is a single dict lookup instead of a
+        # split + nested walk on every call
+        self._flat: Dict[str, Any] = {}
+        self._flatten('', self._config)
+
+    def _flatten(self, prefix: str, value: Any):
+        """Recursively index nested config values under dotted keys."""
+        if isinstance(value, dict):
+            for k, v in value.items():
+                self._flatten(f"{prefix}{k}.", v)
+                self._flat[f"{prefix}{k}"] = v
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         if not Path(self.config_path).exists():
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
             
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
-            
+        # Deep-copy the cached parse before mutating: every Config for
+        # the same (path, mtime) shares the lru_cache'd dict, so in-place
+        # env overrides would leak from one instance into the next
+        config = copy.deepcopy(
+            _load_yaml(self.config_path, os.path.getmtime(self.config_path))
+        )
+
+
         # Override with environment variables
         config['llm']['api_key'] = os.getenv('OPENAI_API_KEY', config['llm'].get('api_key'))
         config['llm']['model'] = os.getenv('LLM_MODEL', config['llm'].get('model', 'gpt-4'))
-        
+
+        # Tokenize the test command once - shlex handles quoted args like
+        # pytest -k "foo and not slow" that str.split would mangle
+        execution = config.get('execution')
+        if execution and execution.get('test_command'):
+            execution['test_command_argv'] = shlex.split(execution['test_command'])
+
         return config
     
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value by key."""
-        keys = key.split('.')
-        value = self._config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k, default)
-            else:
-                return default
-        return value
+        """Get configuration value by dotted key."""
+        return self._flat.get(key, default)
     
     @property
     def llm(self) -> Dict[str, Any]:
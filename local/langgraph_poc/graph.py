@@ -1,6 +1,8 @@
 """LangGraph workflow definition for failure analysis."""
+import asyncio
 from langgraph.graph import StateGraph, END
-from typing import Dict, Any
+from langgraph.types import Send
+from typing import Dict, Any, List, Optional, Tuple
 from .state import FailureAnalysisState
 from .config import Config
 from .nodes.xml_fetcher import xml_report_fetcher
@@ -8,7 +10,7 @@ from .nodes.local_repo_access import local_repo_access
 from .nodes.local_executor import local_executor
 from .nodes.results_collector import results_collector
 from .nodes.root_cause_analyzer import root_cause_analyzer
-from .nodes.report_generator import report_generator
+from .nodes.report_generator import report_generator, report_preparer
 
 
 def create_failure_analysis_graph(config: Config) -> StateGraph:
@@ -22,75 +24,82 @@ def create_failure_analysis_graph(config: Config) -> StateGraph:
     """
     # Create the graph
     workflow = StateGraph(FailureAnalysisState)
-    
+
+    # The XML parse and the repository walk are independent, so they run
+    # concurrently. Both are async; blocking work happens in worker threads.
+    async def _xml_fetcher(state: FailureAnalysisState) -> Dict[str, Any]:
+        return await xml_report_fetcher(state, config)
+
+    async def _local_repo(state: FailureAnalysisState) -> Dict[str, Any]:
+        return await local_repo_access(state, config)
+
+    async def _local_executor(state: FailureAnalysisState) -> Dict[str, Any]:
+        return await local_executor(state, config)
+
+    async def _root_cause_analyzer(state: FailureAnalysisState) -> Dict[str, Any]:
+        return await root_cause_analyzer(state, config)
+
+    # The executor only needs repo_path and the fetcher only needs
+    # xml_report_path, so all three input nodes run concurrently; the
+    # minutes-long local execution hides the XML parse and repo walk
+    # entirely
+    def _fan_out_inputs(state: FailureAnalysisState) -> List[Send]:
+        return [
+            Send("xml_fetcher", state),
+            Send("local_repo", state),
+            Send("local_executor", state),
+        ]
+
+    # The report prefix only depends on collected results, so it renders
+    # while the LLM analysis is still in flight
+    def _fan_out_analysis(state: FailureAnalysisState) -> List[Send]:
+        return [Send("root_cause_analyzer", state), Send("report_preparer", state)]
+
     # Add nodes with config binding
-    workflow.add_node("xml_fetcher", lambda state: xml_report_fetcher(state, config))
-    workflow.add_node("local_repo", lambda state: local_repo_access(state, config))
-    workflow.add_node("local_executor", lambda state: local_executor(state, config))
+    workflow.add_node("dispatch_inputs", lambda state: None)
+    workflow.add_node("xml_fetcher", _xml_fetcher)
+    workflow.add_node("local_repo", _local_repo)
+    workflow.add_node("local_executor", _local_executor)
+    workflow.add_node("join_inputs", lambda state: None)
     workflow.add_node("results_collector", lambda state: results_collector(state, config))
-    workflow.add_node("root_cause_analyzer", lambda state: root_cause_analyzer(state, config))
+    workflow.add_node("dispatch_analysis", lambda state: None)
+    workflow.add_node("root_cause_analyzer", _root_cause_analyzer)
+    workflow.add_node("report_preparer", lambda state: report_preparer(state, config))
     workflow.add_node("report_generator", lambda state: report_generator(state, config))
-    
+
     # Define the workflow edges
-    workflow.set_entry_point("xml_fetcher")
-    
-    # Add conditional routing based on workflow status
-    workflow.add_conditional_edges(
-        "xml_fetcher",
-        lambda state: "error" if state.get("workflow_status") == "error" else "continue",
-        {
-            "continue": "local_repo",
-            "error": END
-        }
-    )
-    
-    workflow.add_conditional_edges(
-        "local_repo",
-        lambda state: "error" if state.get("workflow_status") == "error" else "continue",
-        {
-            "continue": "local_executor",
-            "error": END
-        }
-    )
-    
+    workflow.set_entry_point("dispatch_inputs")
+
+    # Fan out to the input nodes, then barrier before collection
+    workflow.add_conditional_edges("dispatch_inputs", _fan_out_inputs)
+    workflow.add_edge(["xml_fetcher", "local_repo", "local_executor"], "join_inputs")
+
+    # Without a parsed report there is nothing to compare against, so
+    # bail out; executor failures still flow into the collector - a
+    # failing local run is itself a result worth reporting
     workflow.add_conditional_edges(
-        "local_executor",
-        lambda state: "error" if state.get("workflow_status") == "error" else "continue",
+        "join_inputs",
+        lambda state: "error" if state.get("test_results") is None else "continue",
         {
             "continue": "results_collector",
-            "error": "results_collector"
+            "error": END
         }
     )
-    
-    workflow.add_edge("results_collector", "root_cause_analyzer")
-    workflow.add_edge("root_cause_analyzer", "report_generator")
+
+    workflow.add_edge("results_collector", "dispatch_analysis")
+    workflow.add_conditional_edges("dispatch_analysis", _fan_out_analysis)
+    workflow.add_edge(["root_cause_analyzer", "report_preparer"], "report_generator")
     workflow.add_edge("report_generator", END)
     
     # Compile the graph
     return workflow.compile()
 
 
-def run_failure_analysis(
-    xml_report_path: str,
-    repo_path: str,
-    test_name: str = None,
-    config: Config = None
-) -> Dict[str, Any]:
-    """Run the complete failure analysis workflow.
-    
-    Args:
-        xml_report_path: Path to XML test report
-        repo_path: Path to local repository
-        test_name: Optional test identifier
-        config: Configuration object
-        
-    Returns:
-        Final state with analysis results
-    """
-    from datetime import datetime
-    
-    # Create initial state
-    initial_state = {
+def _initial_state(xml_report_path: str, repo_path: str, test_name: str = None) -> Dict[str, Any]:
+    """Build the initial workflow state for one failure."""
+    from datetime import datetime, timezone
+
+    return {
         'xml_report_path': xml_report_path,
         'repo_path': repo_path,
         'test_name': test_name,
@@ -98,6 +107,7 @@ def run_failure_analysis(
         'failure_details': None,
         'code_files': None,
         'local_execution_logs': None,
+        'local_log_length': None,
         'local_exit_code': None,
         'local_errors': None,
         'execution_success': None,
@@ -105,23 +115,91 @@ def run_failure_analysis(
         'root_cause': None,
         'confidence_level': None,
         'recommendations': None,
+        'report_prefix': None,
         'final_report': None,
         'workflow_status': 'started',
         'error_message': None,
-        'timestamp': datetime.utcnow().isoformat()
+        'timestamp': datetime.now(timezone.utc).isoformat()
     }
-    
+
+
+def run_failure_analysis(
+    xml_report_path: str,
+    repo_path: str,
+    test_name: str = None,
+    config: Config = None,
+    on_update=None
+) -> Dict[str, Any]:
+    """Run the complete failure analysis workflow.
+
+    Args:
+        xml_report_path: Path to XML test report
+        repo_path: Path to local repository
+        test_name: Optional test identifier
+        config: Configuration object
+        on_update: Optional callback invoked with the state after every
+            superstep, so callers can surface partial results (e.g. the
+            pre-rendered report prefix) while the LLM is still running
+
+    Returns:
+        Final state with analysis results
+    """
     # Create and run the graph
     graph = create_failure_analysis_graph(config)
-    
+
     print("🚀 Starting failure analysis workflow...")
     print(f"   XML Report: {xml_report_path}")
     print(f"   Repository: {repo_path}")
     if test_name:
         print(f"   Test Name: {test_name}")
     print()
-    
-    # Execute the workflow
-    final_state = graph.invoke(initial_state)
-    
-    return final_state
+
+    # Stream the workflow (async so the input nodes run concurrently);
+    # intermediate states flow to the caller instead of blocking until
+    # the final one
+    async def _run():
+        final_state = None
+        async for state in graph.astream(
+            _initial_state(xml_report_path, repo_path, test_name),
+            stream_mode='values'
+        ):
+            final_state = state
+            if on_update is not None:
+                on_update(state)
+        return final_state
+
+    return asyncio.run(_run())
+
+
+def run_failure_analysis_batch(
+    targets: List[Tuple[str, str, Optional[str]]],
+    config: Config = None,
+    max_concurrency: int = 8
+) -> List[Dict[str, Any]]:
+    """Analyze several failures concurrently.
+
+    The LLM calls are network-bound, so independent analyses overlap
+    instead of serializing one request at a time.
+
+    Args:
+        targets: List of (xml_report_path, repo_path, test_name) tuples
+        config: Configuration object
+        max_concurrency: Maximum analyses in flight at once
+
+    Returns:
+        List of final states, in input order
+    """
+    graph = create_failure_analysis_graph(config)
+
+    print(f"🚀 Starting batch failure analysis ({len(targets)} failures)...")
+
+    async def _run_all():
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _one(xml_report_path, repo_path, test_name):
+            async with sem:
+                return await graph.ainvoke(_initial_state(xml_report_path, repo_path, test_name))
+
+        return await asyncio.gather(*(_one(*target) for target in targets))
+
+    return list(asyncio.run(_run_all()))
@@ -1,5 +1,7 @@
 """Main entry point for the LangGraph POC."""
 import argparse
+import os
+import stat
 import sys
 from pathlib import Path
 from .config import Config
@@ -38,25 +40,49 @@ def main():
     args = parser.parse_args()
     
     try:
-        # Validate paths
-        if not Path(args.xml_report).exists():
-            print(f"❌ XML report not found: {args.xml_report}")
+        # Validate paths - one stat each, and check the file type while
+        # we have the mode, so mixing up the two arguments fails here
+        # with a clear message instead of deep in a node
+        try:
+            xml_stat = os.stat(args.xml_report)
+        except OSError as e:
+            print(f"❌ XML report not found: {args.xml_report} ({e.strerror})")
             sys.exit(1)
-        
-        if not Path(args.repo_path).exists():
-            print(f"❌ Repository path not found: {args.repo_path}")
+        if not stat.S_ISREG(xml_stat.st_mode):
+            print(f"❌ XML report is not a regular file: {args.xml_report}")
+            sys.exit(1)
+
+        try:
+            repo_stat = os.stat(args.repo_path)
+        except OSError as e:
+            print(f"❌ Repository path not found: {args.repo_path} ({e.strerror})")
+            sys.exit(1)
+        if not stat.S_ISDIR(repo_stat.st_mode):
+            print(f"❌ Repository path is not a directory: {args.repo_path}")
             sys.exit(1)
         
         # Load configuration
         print("Loading configuration...")
         config = Config(args.config)
         
+        # Write the pre-rendered report shell as soon as it exists so the
+        # output file shows progress while the LLM is still generating
+        prefix_written = set()
+
+        def _on_update(state):
+            if args.output and state.get('report_prefix') and not prefix_written:
+                output_path = Path(args.output)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                output_path.write_text(state['report_prefix'] + "\n*Root cause analysis in progress...*\n")
+                prefix_written.add(True)
+
         # Run the analysis
         final_state = run_failure_analysis(
             xml_report_path=args.xml_report,
             repo_path=args.repo_path,
             test_name=args.test_name,
-            config=config
+            config=config,
+            on_update=_on_update
         )
         
         # Print results
@@ -1,98 +1,276 @@
 """Node for executing code locally."""
-import subprocess
+import asyncio
+import hashlib
+import importlib.util
 import os
-from typing import Dict, Any
+import re
+import shlex
+import signal
+import zlib
+from collections import deque
+from typing import Dict, Any, List, Tuple
 from pathlib import Path
 from ..state import FailureAnalysisState
 from ..config import Config
 
+_ERROR_RE = re.compile(r'(FAIL|ERROR|Traceback)', re.I)
 
-def local_executor(state: FailureAnalysisState, config: Config) -> Dict[str, Any]:
+# Logs above this size are zlib-compressed in state - verbose runs can
+# reach MBs of text that every state copy/checkpoint would otherwise drag
+# along uncompressed
+_COMPRESS_THRESHOLD = 64 * 1024
+_COMPRESSED_PREFIX = '__zlib__:'
+
+
+def _maybe_compress_logs(logs: str) -> str:
+    """Compress large log blobs; small ones stay readable in place."""
+    if len(logs) <= _COMPRESS_THRESHOLD:
+        return logs
+    return _COMPRESSED_PREFIX + zlib.compress(logs.encode()).decode('latin1')
+
+
+def decompress_logs(logs: str) -> str:
+    """Return the raw log text, decompressing if the executor compressed it."""
+    if logs and logs.startswith(_COMPRESSED_PREFIX):
+        return zlib.decompress(logs[len(_COMPRESSED_PREFIX):].encode('latin1')).decode()
+    return logs
+
+
+# Completed installs leave a marker keyed by the manifest content hash,
+# so unchanged requirements skip the PyPI/npm round-trip entirely on
+# the next run - by far the common case
+_INSTALL_CACHE_DIR = Path.home() / '.cache' / 'automation_failure_solver'
+
+
+def _install_marker(prefix: str, manifests: List[Path]) -> Path:
+    """Marker path for an install whose inputs are the given manifests."""
+    h = hashlib.blake2b(digest_size=16)
+    for manifest in manifests:
+        h.update(manifest.name.encode())
+        h.update(manifest.read_bytes())
+    return _INSTALL_CACHE_DIR / f'{prefix}-{h.hexdigest()}.ok'
+
+
+class StreamingLogClassifier:
+    """Single-pass line classifier for subprocess output.
+
+    Each line is classified as it arrives: matched error lines are
+    retained, everything else only survives in a bounded tail. Memory
+    stays O(tail size) regardless of total log volume, and no full-buffer
+    rescans are needed afterwards.
+    """
+
+    def __init__(self, tail_lines: int = 500):
+        self.tail: deque = deque(maxlen=tail_lines)
+        self.errors: List[str] = []
+        self.total_chars = 0
+
+    def feed(self, line: str):
+        """Classify one decoded output line."""
+        self.total_chars += len(line)
+        self.tail.append(line)
+        if _ERROR_RE.search(line):
+            self.errors.append(line.rstrip('\n'))
+
+    def text(self) -> str:
+        """Return the retained tail as a single string."""
+        return ''.join(self.tail)
+
+
+async def _run_streamed(cmd, timeout: int, cwd: str = None, shell: bool = False) -> Tuple[int, StreamingLogClassifier, StreamingLogClassifier]:
+    """Run a command without blocking the event loop.
+
+    Output is fed line-by-line into per-stream classifiers, so multi-MB
+    test logs never buffer fully in memory.
+
+    Args:
+        cmd: Command and arguments (a single string when shell is True)
+        timeout: Seconds to wait before killing the process
+        cwd: Working directory for the command
+        shell: Run through /bin/sh (only for commands that need pipes)
+
+    Returns:
+        Tuple of (exit_code, stdout_classifier, stderr_classifier)
+    """
+    # start_new_session puts the command in its own process group, so a
+    # timeout can kill the whole tree - test runners routinely fork
+    # helpers that would otherwise outlive proc.kill() and keep the pipes
+    # (and ports) open
+    # The default StreamReader limit is 64KB per line; pip progress bars
+    # and assertion dumps routinely exceed that, and an overrun raises
+    # mid-drain and reports a healthy run as failed
+    kwargs = dict(
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+        start_new_session=True,
+        limit=1 << 22
+    )
+    if shell:
+        proc = await asyncio.create_subprocess_shell(cmd, **kwargs)
+    else:
+        proc = await asyncio.create_subprocess_exec(*cmd, **kwargs)
+
+    out = StreamingLogClassifier()
+    err = StreamingLogClassifier()
+
+    async def _drain(stream, classifier):
+        async for line in stream:
+            classifier.feed(line.decode(errors='replace'))
+
+    drains = asyncio.gather(
+        _drain(proc.stdout, out),
+        _drain(proc.stderr, err)
+    )
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        # SIGTERM the whole group first so runners can flush reports,
+        # then SIGKILL stragglers after a short grace period
+        try:
+            pgid = os.getpgid(proc.pid)
+            os.killpg(pgid, signal.SIGTERM)
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=2)
+            except asyncio.TimeoutError:
+                os.killpg(pgid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await proc.wait()
+        drains.cancel()
+        # Let the cancellation land - an un-awaited cancelled task dies
+        # with a "Task was destroyed but it is pending" warning
+        await asyncio.gather(drains, return_exceptions=True)
+        raise
+    await drains
+
+    return proc.returncode, out, err
+
+
+async def local_executor(state: FailureAnalysisState, config: Config) -> Dict[str, Any]:
     """Execute automation code locally.
-    
+
     Args:
         state: Current workflow state
         config: Configuration object
-        
+
     Returns:
         Updated state dictionary
     """
     print("🔧 Executing code locally...")
-    
+
     try:
         execution_config = config.execution
+        # cwd= on the subprocesses instead of os.chdir: the working
+        # directory is process-global, so chdir would race concurrent
+        # executor runs in the batch path
         repo_path = state['repo_path']
-        
-        # Change to repository directory
-        original_dir = os.getcwd()
-        os.chdir(repo_path)
-        
+        repo_dir = Path(repo_path)
+
         errors = []
         logs = []
         exit_code = 0
-        
-        try:
-            # Install dependencies if needed
-            if execution_config.get('install_dependencies', True):
-                print("   Installing dependencies...")
-                if Path('requirements.txt').exists():
-                    result = subprocess.run(
-                        ['pip', 'install', '-r', 'requirements.txt'],
-                        capture_output=True,
-                        text=True,
-                        timeout=execution_config.get('dependency_timeout', 300)
-                    )
-                    logs.append(f"Dependency installation:\n{result.stdout}")
-                    if result.returncode != 0:
-                        errors.append(f"Dependency installation failed: {result.stderr}")
-                
-                if Path('package.json').exists():
-                    result = subprocess.run(
-                        ['npm', 'install'],
-                        capture_output=True,
-                        text=True,
-                        timeout=execution_config.get('dependency_timeout', 300)
-                    )
-                    logs.append(f"NPM installation:\n{result.stdout}")
-                    if result.returncode != 0:
-                        errors.append(f"NPM installation failed: {result.stderr}")
-            
-            # Execute test command
-            test_command = execution_config.get('test_command', 'pytest')
-            print(f"   Running: {test_command}")
-            
-            result = subprocess.run(
-                test_command.split(),
-                capture_output=True,
-                text=True,
-                timeout=execution_config.get('execution_timeout', 600)
+        log_length = 0
+
+        # Install dependencies if needed. pip and npm are independent and
+        # network-bound, so they run concurrently - the slower one hides
+        # the other's latency entirely
+        if execution_config.get('install_dependencies', True):
+            print("   Installing dependencies...")
+            dep_timeout = execution_config.get('dependency_timeout', 300)
+            installs = []
+            # One pip invocation with every requirements file - N separate
+            # installs would pay pip's startup and resolver cost N times
+            req_files = sorted(p.name for p in repo_dir.glob('requirements*.txt'))
+            if req_files:
+                # Prefer wheels over sdists - building from source is the
+                # slow path and these installs are throwaway
+                pip_cmd = ['pip', 'install', '--prefer-binary']
+                for req in req_files:
+                    pip_cmd += ['-r', req]
+                marker = _install_marker('req', [repo_dir / req for req in req_files])
+                installs.append(('Dependency installation', pip_cmd, marker))
+            if (repo_dir / 'package.json').exists():
+                # npm ci is much faster than npm install when a lockfile exists
+                has_lock = (repo_dir / 'package-lock.json').exists()
+                npm_cmd = ['npm', 'ci'] if has_lock else ['npm', 'install']
+                npm_manifest = repo_dir / ('package-lock.json' if has_lock else 'package.json')
+                installs.append(('NPM installation', npm_cmd, _install_marker('npm', [npm_manifest])))
+
+            # Marker already present means these exact manifests installed
+            # successfully before - skip the network round-trip
+            skipped = [i for i in installs if i[2].exists()]
+            installs = [i for i in installs if not i[2].exists()]
+            for label, _, _ in skipped:
+                logs.append(f"{label} skipped (manifests unchanged since last successful install)")
+
+            results = await asyncio.gather(
+                *(_run_streamed(cmd, timeout=dep_timeout, cwd=repo_path)
+                  for _, cmd, _ in installs)
             )
-            
-            logs.append(f"Test execution:\n{result.stdout}\n{result.stderr}")
-            exit_code = result.returncode
-            
-            if exit_code != 0:
-                errors.append(f"Tests failed with exit code {exit_code}")
-                errors.append(result.stderr)
-            
-        finally:
-            os.chdir(original_dir)
-        
+            for (label, _, marker), (returncode, out, err) in zip(installs, results):
+                logs.append(f"{label}:\n{out.text()}")
+                log_length += out.total_chars + err.total_chars
+                if returncode != 0:
+                    # Truncate at ingestion - downstream formatters and the
+                    # LLM prompt carry these strings as-is
+                    errors.append(f"{label} failed: {err.text()[-2000:]}")
+                else:
+                    marker.parent.mkdir(parents=True, exist_ok=True)
+                    marker.touch()
+
+        # Execute test command
+        test_command = execution_config.get('test_command', 'pytest')
+        # shell=True is an explicit opt-in for commands that need pipes;
+        # the default skips the /bin/sh fork+exec entirely
+        use_shell = execution_config.get('shell', False)
+        if use_shell:
+            argv = test_command
+        else:
+            argv = list(execution_config.get('test_command_argv') or shlex.split(test_command))
+
+            # Spread independent tests across cores when xdist is available;
+            # fail_fast short-circuits obviously broken builds
+            if argv and Path(argv[0]).name == 'pytest':
+                if execution_config.get('parallel', True) and importlib.util.find_spec('xdist'):
+                    argv[1:1] = ['-n', 'auto', '--dist', 'loadfile']
+                if execution_config.get('fail_fast'):
+                    argv.insert(1, '--maxfail=1')
+
+        print(f"   Running: {argv if use_shell else ' '.join(argv)}")
+
+        exit_code, out, err = await _run_streamed(
+            argv,
+            timeout=execution_config.get('execution_timeout', 600),
+            cwd=repo_path,
+            shell=use_shell
+        )
+
+        logs.append(f"Test execution:\n{out.text()}\n{err.text()}")
+        log_length += out.total_chars + err.total_chars
+
+        if exit_code != 0:
+            errors.append(f"Tests failed with exit code {exit_code}")
+            # Matched error lines from the streaming pass, not the
+            # whole stderr buffer
+            errors.extend((out.errors + err.errors)[:50])
+
         execution_success = exit_code == 0 and len(errors) == 0
-        
+
         print(f"{'✅' if execution_success else '❌'} Local execution completed")
         print(f"   Exit code: {exit_code}")
         print(f"   Errors: {len(errors)}")
-        
+
         return {
-            'local_execution_logs': '\n'.join(logs),
+            'local_execution_logs': _maybe_compress_logs('\n'.join(logs)),
+            'local_log_length': log_length,
             'local_exit_code': exit_code,
             'local_errors': errors,
             'execution_success': execution_success,
             'workflow_status': 'executed_locally'
         }
-        
-    except subprocess.TimeoutExpired:
+
+    except asyncio.TimeoutError:
         print("❌ Local execution timed out")
         return {
             'local_execution_logs': 'Execution timed out',
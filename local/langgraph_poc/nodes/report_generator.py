@@ -1,153 +1,169 @@
 """Node for generating final report."""
+from itertools import islice
 from typing import Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
+import jinja2
 from ..state import FailureAnalysisState
 from ..config import Config
 
 
-def report_generator(state: FailureAnalysisState, config: Config) -> Dict[str, Any]:
-    """Generate comprehensive failure analysis report.
-    
-    Args:
-        state: Current workflow state
-        config: Configuration object
-        
-    Returns:
-        Updated state dictionary
-    """
-    print("📝 Generating report...")
-    
-    try:
-        collected_data = state.get('collected_data', {})
-        
-        # Helper functions
-        def format_failure_details(failure_details: Dict[str, Any]) -> str:
-            if not failure_details:
-                return "No failure details available."
-            
-            output = []
-            test_failures = failure_details.get('test_failures', [])
-            
-            if test_failures:
-                output.append(f"\n**Test Failures:** {len(test_failures)}\n")
-                for i, failure in enumerate(test_failures[:5], 1):
-                    output.append(f"{i}. **{failure.get('name')}**")
-                    output.append(f"   - Class: `{failure.get('class')}`")
-                    if failure.get('message'):
-                        output.append(f"   - Message: {failure.get('message')[:200]}")
-            
-            if failure_details.get('has_compilation_error'):
-                output.append("\n⚠️ **Compilation Error Detected**")
-            
-            if failure_details.get('has_timeout'):
-                output.append("\n⏱️ **Timeout Detected**")
-            
-            return '\n'.join(output) if output else "No specific failures identified."
-        
-        def format_local_errors(errors: list) -> str:
-            if not errors:
-                return ""
-            
-            output = ["\n**Local Error Details:**\n"]
-            for i, error in enumerate(errors[:5], 1):
-                output.append(f"{i}. ```\n{error[:500]}\n```")
-            
-            if len(errors) > 5:
-                output.append(f"\n*... and {len(errors) - 5} more errors*")
-            
-            return '\n'.join(output)
-        
-        def format_consistency_analysis(comparison: Dict[str, Any]) -> str:
-            if comparison['consistent_failure']:
-                return """
+def format_failure_details(failure_details: Dict[str, Any]) -> str:
+    """Format XML failure details as markdown."""
+    if not failure_details:
+        return "No failure details available."
+
+    output = []
+    test_failures = failure_details.get('test_failures', [])
+
+    if test_failures:
+        output.append(f"\n**Test Failures:** {len(test_failures)}\n")
+        # islice works on any iterable and never materializes the tail
+        for i, failure in enumerate(islice(test_failures, 5), 1):
+            output.append(f"{i}. **{failure.get('name')}**")
+            output.append(f"   - Class: `{failure.get('class')}`")
+            if failure.get('message'):
+                # Messages are truncated at ingestion in the XML fetcher
+                output.append(f"   - Message: {failure.get('message')}")
+
+    if failure_details.get('has_compilation_error'):
+        output.append("\n⚠️ **Compilation Error Detected**")
+
+    if failure_details.get('has_timeout'):
+        output.append("\n⏱️ **Timeout Detected**")
+
+    return '\n'.join(output) if output else "No specific failures identified."
+
+
+def format_local_errors(errors: list) -> str:
+    """Format local execution errors as markdown."""
+    if not errors:
+        return ""
+
+    output = ["\n**Local Error Details:**\n"]
+    for i, error in enumerate(islice(errors, 5), 1):
+        output.append(f"{i}. ```\n{error}\n```")
+
+    if len(errors) > 5:
+        output.append(f"\n*... and {len(errors) - 5} more errors*")
+
+    return '\n'.join(output)
+
+
+# Fixed analysis blurbs, built once at import instead of re-creating the
+# literals inside the formatter on every call
+_ANALYSIS_CONSISTENT = """
 ### Analysis
 The failure is **consistent** between XML report and local execution. This suggests:
 - The issue is in the code itself, not environment-specific
 - The failure is reproducible
 - Fix should work in both environments
 """
-            elif comparison['xml_failed'] and not comparison['local_failed']:
-                return """
+
+_ANALYSIS_XML_ONLY = """
 ### Analysis
 The failure occurs **only in original test**, not locally. This suggests:
 - Environment-specific issue (dependencies, configuration, resources)
 - Possible infrastructure problem
 - Timing or concurrency issue
 """
-            elif not comparison['xml_failed'] and comparison['local_failed']:
-                return """
+
+_ANALYSIS_LOCAL_ONLY = """
 ### Analysis
 The failure occurs **only locally**, not in original test. This suggests:
 - Local environment configuration issue
 - Missing dependencies locally
 - Different test data or setup
 """
-            else:
-                return """
+
+_ANALYSIS_BOTH_OK = """
 ### Analysis
 Both original and local execution succeeded. The original failure may have been:
 - Transient/intermittent issue
 - Already fixed in current code
 - Environment-specific and resolved
 """
-        
-        def format_recommendations(recommendations: list) -> str:
-            if not recommendations:
-                return "No specific recommendations available."
-            
-            output = []
-            for i, rec in enumerate(recommendations, 1):
-                output.append(f"{i}. {rec}")
-            
-            return '\n'.join(output)
-        
-        report = f"""
+
+
+def format_consistency_analysis(comparison) -> str:
+    """Explain what the XML-vs-local comparison suggests."""
+    if comparison.consistent_failure:
+        return _ANALYSIS_CONSISTENT
+    elif comparison.xml_failed and not comparison.local_failed:
+        return _ANALYSIS_XML_ONLY
+    elif not comparison.xml_failed and comparison.local_failed:
+        return _ANALYSIS_LOCAL_ONLY
+    else:
+        return _ANALYSIS_BOTH_OK
+
+
+def format_recommendations(recommendations: list) -> str:
+    """Format recommendations as a numbered markdown list."""
+    if not recommendations:
+        return "No specific recommendations available."
+
+    return '\n'.join(f"{i}. {rec}" for i, rec in enumerate(recommendations, 1))
+
+
+# Compiled once at import - Jinja's bytecode beats rebuilding a giant
+# f-string plus thousands of intermediate list/join allocations per report.
+# The template is split so everything that does not depend on the LLM can
+# be pre-rendered while the analyzer call is still in flight.
+_PREFIX_TEMPLATE_STR = """
 # Test Failure Analysis Report
 
-**Generated:** {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}
+**Generated:** {{ now.strftime('%Y-%m-%d %H:%M:%S UTC') }}
 
 ## Summary
 
-- **Test Name:** {state.get('test_name', 'N/A')}
-- **XML Report:** {state['xml_report_path']}
-- **Test Result:** {collected_data['test_report']['result']}
-- **Total Tests:** {collected_data['test_report']['total_tests']}
-- **Failure Count:** {collected_data['test_report']['failure_details']['failure_count'] if collected_data['test_report']['failure_details'] else 0}
+- **Test Name:** {{ state.get('test_name') or 'N/A' }}
+- **XML Report:** {{ state['xml_report_path'] }}
+- **Test Result:** {{ collected.test_report.result }}
+- **Total Tests:** {{ collected.test_report.total_tests }}
+- **Failure Count:** {{ collected.test_report.failure_details['failure_count'] if collected.test_report.failure_details else 0 }}
 
 ## Repository Information
 
-- **Path:** {collected_data['repository']['path']}
-- **Files Analyzed:** {collected_data['repository']['file_count']}
+- **Path:** {{ collected.repository.path }}
+- **Files Analyzed:** {{ collected.repository.file_count }}
 
 ## Failure Details
 
 ### XML Report Failures
-{format_failure_details(state.get('failure_details', {}))}
+{% if state.get('failure_details') %}
+{{ state['failure_details'] | failures }}
+{% else %}
+No failure details available.
+{% endif %}
 
 ### Local Execution Results
-- **Exit Code:** {state.get('local_exit_code', 'N/A')}
-- **Status:** {'✅ Passed' if state.get('execution_success') else '❌ Failed'}
-- **Errors:** {len(state.get('local_errors', []))}
+{% set errs = state.get('local_errors') or [] %}
+- **Exit Code:** {{ state.get('local_exit_code') if state.get('local_exit_code') is not none else 'N/A' }}
+- **Status:** {{ '✅ Passed' if state.get('execution_success') else '❌ Failed' }}
+- **Errors:** {{ errs | length }}
 
-{format_local_errors(state.get('local_errors', []))}
+{% if errs %}
+{{ errs | local_errors }}
+{% endif %}
 
 ## Comparison
 
-- **XML Report Failed:** {'Yes' if collected_data['comparison']['xml_failed'] else 'No'}
-- **Local Failed:** {'Yes' if collected_data['comparison']['local_failed'] else 'No'}
-- **Consistent Failure:** {'Yes ⚠️' if collected_data['comparison']['consistent_failure'] else 'No'}
+- **XML Report Failed:** {{ 'Yes' if collected.comparison.xml_failed else 'No' }}
+- **Local Failed:** {{ 'Yes' if collected.comparison.local_failed else 'No' }}
+- **Consistent Failure:** {{ 'Yes ⚠️' if collected.comparison.consistent_failure else 'No' }}
 
-{format_consistency_analysis(collected_data['comparison'])}
+{{ collected.comparison | consistency }}
+"""
 
+_ANALYSIS_TEMPLATE_STR = """
 ## Root Cause Analysis
 
-**Confidence Level:** {state.get('confidence_level', 0):.1%}
+**Confidence Level:** {{ '%.1f%%' % ((state.get('confidence_level') or 0) * 100) }}
 
-{state.get('root_cause', 'No analysis available')}
+{{ state.get('root_cause') or 'No analysis available' }}
 
 ## Recommendations
 
-{format_recommendations(state.get('recommendations', []))}
+{{ state.get('recommendations', []) | recommendations }}
 
 ## Next Steps
 
@@ -160,14 +176,68 @@ Both original and local execution succeeded. The original failure may have been:
 
 *This report was generated automatically using LangGraph POC for failure analysis.*
 """
-        
+
+_env = jinja2.Environment(autoescape=False, trim_blocks=True, lstrip_blocks=True)
+_env.filters['failures'] = format_failure_details
+_env.filters['local_errors'] = format_local_errors
+_env.filters['consistency'] = format_consistency_analysis
+_env.filters['recommendations'] = format_recommendations
+_PREFIX_TMPL = _env.from_string(_PREFIX_TEMPLATE_STR)
+_ANALYSIS_TMPL = _env.from_string(_ANALYSIS_TEMPLATE_STR)
+
+
+def _render_prefix(state: FailureAnalysisState) -> str:
+    """Render the report sections that don't depend on the LLM."""
+    return _PREFIX_TMPL.render(
+        state=state,
+        collected=state.get('collected_data', {}),
+        now=datetime.now(timezone.utc)
+    )
+
+
+def report_preparer(state: FailureAnalysisState, config: Config) -> Dict[str, Any]:
+    """Pre-render the report prefix while the LLM call is in flight.
+
+    Args:
+        state: Current workflow state
+        config: Configuration object
+
+    Returns:
+        Updated state dictionary
+    """
+    try:
+        return {'report_prefix': _render_prefix(state)}
+    except Exception as e:
+        print(f"⚠️ Report pre-rendering failed: {str(e)}")
+        return {'report_prefix': None}
+
+
+def report_generator(state: FailureAnalysisState, config: Config) -> Dict[str, Any]:
+    """Generate comprehensive failure analysis report.
+
+    Splices the analysis results into the pre-rendered prefix; renders
+    the prefix inline if the preparer didn't run.
+
+    Args:
+        state: Current workflow state
+        config: Configuration object
+
+    Returns:
+        Updated state dictionary
+    """
+    print("📝 Generating report...")
+
+    try:
+        prefix = state.get('report_prefix') or _render_prefix(state)
+        report = prefix + _ANALYSIS_TMPL.render(state=state)
+
         print("✅ Report generated successfully")
-        
+
         return {
             'final_report': report,
             'workflow_status': 'completed'
         }
-        
+
     except Exception as e:
         print(f"❌ Report generation failed: {str(e)}")
         return {
@@ -1,54 +1,66 @@
 """Node for collecting all results."""
 from typing import Dict, Any
-from ..state import FailureAnalysisState
+from ..state import (
+    FailureAnalysisState,
+    CollectedData,
+    TestReportData,
+    RepositoryData,
+    ExecutionData,
+    Comparison,
+)
 from ..config import Config
 
 
 def results_collector(state: FailureAnalysisState, config: Config) -> Dict[str, Any]:
     """Collect all results from previous nodes.
-    
+
     Args:
         state: Current workflow state
         config: Configuration object
-        
+
     Returns:
         Updated state dictionary
     """
     print("📊 Collecting results...")
-    
-    collected_data = {
-        'test_report': {
-            'xml_path': state['xml_report_path'],
-            'test_name': state.get('test_name', 'N/A'),
-            'result': state['failure_details']['result'] if state.get('failure_details') else None,
-            'failure_details': state.get('failure_details'),
-            'total_tests': state.get('test_results', {}).get('total_tests', 0),
-        },
-        'repository': {
-            'path': state.get('repo_path'),
-            'file_count': len(state.get('code_files', [])),
-        },
-        'local_execution': {
-            'success': state.get('execution_success'),
-            'exit_code': state.get('local_exit_code'),
-            'error_count': len(state.get('local_errors', [])),
-            'log_length': len(state.get('local_execution_logs', '')),
-        },
-        'comparison': {
-            'xml_failed': state.get('failure_details', {}).get('result') != 'SUCCESS',
-            'local_failed': not state.get('execution_success', False),
-            'consistent_failure': (
-                state.get('failure_details', {}).get('result') != 'SUCCESS' and
-                not state.get('execution_success', False)
-            ),
-        }
-    }
-    
+
+    # Bind each state key once - the values feed several fields below
+    failure_details = state.get('failure_details')
+    execution_success = state.get('execution_success')
+    xml_failed = (failure_details or {}).get('result') != 'SUCCESS'
+    local_failed = not execution_success
+
+    collected_data = CollectedData(
+        test_report=TestReportData(
+            xml_path=state['xml_report_path'],
+            test_name=state.get('test_name') or 'N/A',
+            result=failure_details['result'] if failure_details else None,
+            failure_details=failure_details,
+            total_tests=(state.get('test_results') or {}).get('total_tests', 0),
+        ),
+        repository=RepositoryData(
+            path=state.get('repo_path'),
+            file_count=len(state.get('code_files') or []),
+        ),
+        local_execution=ExecutionData(
+            success=execution_success,
+            exit_code=state.get('local_exit_code'),
+            error_count=len(state.get('local_errors') or []),
+            # Running counter from the streaming pass - the retained logs
+            # are only a tail of the full output
+            log_length=state.get('local_log_length') or len(state.get('local_execution_logs') or ''),
+        ),
+        comparison=Comparison(
+            xml_failed=xml_failed,
+            local_failed=local_failed,
+            consistent_failure=xml_failed and local_failed,
+        ),
+    )
+
     print("✅ Results collected")
-    print(f"   XML failures: {collected_data['test_report']['failure_details']['failure_count'] if collected_data['test_report']['failure_details'] else 0}")
-    print(f"   Local execution: {'Failed' if collected_data['local_execution']['exit_code'] != 0 else 'Passed'}")
-    print(f"   Consistent failure: {collected_data['comparison']['consistent_failure']}")
-    
+    print(f"   XML failures: {failure_details['failure_count'] if failure_details else 0}")
+    print(f"   Local execution: {'Failed' if collected_data.local_execution.exit_code != 0 else 'Passed'}")
+    print(f"   Consistent failure: {collected_data.comparison.consistent_failure}")
+
     return {
         'collected_data': collected_data,
         'workflow_status': 'results_collected'
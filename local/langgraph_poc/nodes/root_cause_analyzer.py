@@ -1,35 +1,72 @@
 """Node for analyzing root cause using LLM."""
-from typing import Dict, Any
+import functools
+import hashlib
+import re
+import time
+from itertools import islice
+
+import httpx
+import orjson
+from pathlib import Path
+from typing import Dict, Any, List, Literal, Optional
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
+from pydantic import BaseModel, Field
 from ..state import FailureAnalysisState
 from ..config import Config
 
 
-def root_cause_analyzer(state: FailureAnalysisState, config: Config) -> Dict[str, Any]:
-    """Analyze root cause of failure using LLM.
-    
-    Args:
-        state: Current workflow state
-        config: Configuration object
-        
-    Returns:
-        Updated state dictionary
-    """
-    print("🔍 Analyzing root cause...")
-    
+class RootCauseAnalysis(BaseModel):
+    """Structured analyzer output - the LLM fills this directly, so no
+    fragile free-text section parsing is needed."""
+
+    root_cause: str = Field(description="Detailed explanation of the root cause")
+    confidence: float = Field(ge=0, le=1, description="Confidence level from 0.0 to 1.0")
+    recommendations: List[str] = Field(default_factory=list,
+                                       description="Actionable steps to fix the issue")
+    category: Literal['environment', 'code', 'infrastructure', 'other'] = Field(
+        default='other', description="Failure category")
+
+
+# The LLM call dominates wall clock and cost; with temperature 0 the same
+# prompt variables always yield the same analysis, so identical failures
+# can be answered from a local cache instead of re-billed
+_CACHE_DIR = Path.home() / '.cache' / 'failure_analysis'
+_CACHE_TTL = 86400  # seconds
+
+
+def _cache_key(model: str, prompt_vars: Dict[str, Any]) -> str:
+    """Deterministic SHA256 key over the model and sorted prompt variables."""
+    # orjson emits sorted bytes directly - no str round-trip + encode
+    payload = orjson.dumps({'model': model, 'vars': prompt_vars},
+                           option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[str]:
+    """Return a cached analysis, or None if missing or expired."""
+    path = _CACHE_DIR / f'{key}.txt'
     try:
-        # Initialize LLM
-        llm_config = config.llm
-        llm = ChatOpenAI(
-            model=llm_config['model'],
-            api_key=llm_config['api_key'],
-            temperature=0.3
-        )
-        
-        # Prepare analysis prompt
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an expert automation engineer analyzing test failures.
+        if time.time() - path.stat().st_mtime < _CACHE_TTL:
+            return path.read_text(encoding='utf-8')
+    except OSError:
+        pass
+    return None
+
+
+def _cache_set(key: str, content: str):
+    """Store an analysis in the cache (best-effort)."""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (_CACHE_DIR / f'{key}.txt').write_text(content, encoding='utf-8')
+    except OSError:
+        pass
+
+
+# Built once at import - the template compiles its variable slots and
+# never changes between invocations
+_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an expert automation engineer analyzing test failures.
 Your task is to identify the root cause of failures by comparing XML test reports with local execution results.
 Provide a detailed analysis with:
 1. Root cause identification
@@ -37,7 +74,7 @@ Provide a detailed analysis with:
 3. Specific recommendations for fixing the issue
 4. Whether the issue is environment-related, code-related, or infrastructure-related
 """),
-            ("user", """Analyze this test failure:
+    ("user", """Analyze this test failure:
 
 XML TEST REPORT:
 Path: {xml_path}
@@ -71,71 +108,187 @@ Please provide:
 3. Recommendations (list of actionable steps)
 4. Failure Category (environment/code/infrastructure/other)
 """)
-        ])
-        
-        # Prepare data for prompt
-        collected_data = state.get('collected_data', {})
-        failure_details = state.get('failure_details', {})
-        
-        error_lines = '\n'.join(failure_details.get('error_lines', [])[:20])
-        local_errors = '\n'.join(state.get('local_errors', [])[:10])
+])
+
+
+# Shared connection pools for every LLM client - otherwise each
+# ChatOpenAI spins up its own httpx client and pays a fresh TLS
+# handshake, which dominates small prompts during batch analysis
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10)
+_http_client = httpx.Client(limits=_HTTP_LIMITS)
+_http_async_client = httpx.AsyncClient(limits=_HTTP_LIMITS)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_llm(model: str, api_key: str) -> ChatOpenAI:
+    """Build (and reuse) the LLM client for a given config.
+
+    Caching plus the shared httpx pools keep keep-alive TCP connections
+    alive across invocations and across models. temperature 0 makes the
+    call deterministic, which is what makes exact-key caching of
+    responses sound.
+    """
+    return ChatOpenAI(model=model, api_key=api_key, temperature=0.0,
+                      http_client=_http_client,
+                      http_async_client=_http_async_client)
+
+
+# Volatile tokens that make otherwise-identical log lines look distinct
+_VOLATILE_LINE_RE = re.compile(r'0x[0-9a-f]+|\d{4}-\d{2}-\d{2}T[\d:.]+|pid=\d+')
+
+
+def dedupe_errors(lines, n: int = 20) -> List[str]:
+    """Keep the first n unique error lines, ignoring volatile tokens.
+
+    Real logs repeat the same stack trace dozens of times; deduplicating
+    by normalized content fits more distinct signal into the prompt's
+    line budget and wastes fewer tokens.
+
+    Args:
+        lines: Iterable of error lines
+        n: Maximum lines to keep
+
+    Returns:
+        Unique lines in first-occurrence order
+    """
+    seen = set()
+    out = []
+    for line in lines:
+        key = _VOLATILE_LINE_RE.sub('', line)
+        if key in seen:
+            continue
+        seen.add(key)
+        out.append(line)
+        if len(out) >= n:
+            break
+    return out
+
+
+def _parse_cached(serialized: Optional[str]) -> Optional[RootCauseAnalysis]:
+    """Revive a cached analysis; stale or non-JSON entries are misses."""
+    if serialized is None:
+        return None
+    try:
+        return RootCauseAnalysis.model_validate_json(serialized)
+    except ValueError:
+        return None
+
+
+_semantic_cache = None
+
+
+def _get_semantic_cache():
+    """Lazily build the shared SemanticLLMCache (faiss import is deferred)."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        from ..clients.llm_cache import SemanticLLMCache
+        _semantic_cache = SemanticLLMCache()
+    return _semantic_cache
+
+
+async def root_cause_analyzer(state: FailureAnalysisState, config: Config) -> Dict[str, Any]:
+    """Analyze root cause of failure using LLM.
+    
+    Args:
+        state: Current workflow state
+        config: Configuration object
         
-        # Get analysis from LLM
-        chain = prompt | llm
-        response = chain.invoke({
+    Returns:
+        Updated state dictionary
+    """
+    print("🔍 Analyzing root cause...")
+
+    try:
+        collected_data = state['collected_data']
+
+        # Healthy run: nothing failed on either side, so an LLM round-trip
+        # would only burn seconds and tokens to say so
+        comparison = collected_data.comparison
+        if not comparison.xml_failed and not comparison.local_failed:
+            print("✅ No failure detected - skipping LLM analysis")
+            return {
+                'root_cause': 'No failure detected',
+                'confidence_level': 1.0,
+                'recommendations': [],
+                'workflow_status': 'analyzed'
+            }
+
+        # LLM client is cached per config - reuses its keep-alive
+        # connection pool across invocations
+        llm_config = config.llm
+        llm = _get_llm(llm_config['model'], llm_config['api_key'])
+        prompt = _PROMPT
+        failure_details = state.get('failure_details') or {}
+        local_error_list = state.get('local_errors') or []
+
+        # Deduplicate repeated stack traces before spending prompt tokens
+        # on them; dedupe_errors caps the line count itself
+        error_lines = '\n'.join(dedupe_errors(failure_details.get('error_lines', []), 20))
+        local_errors = '\n'.join(dedupe_errors(local_error_list, 10))
+
+        # Compact markdown instead of repr()ing dicts into the prompt -
+        # same information, a fraction of the tokens
+        failure_summary = '\n'.join(
+            f"- {f.get('name')} ({f.get('class')}): {f.get('message')}"
+            for f in islice(failure_details.get('test_failures', []), 5)
+        ) or 'None'
+
+        prompt_vars = {
             'xml_path': state['xml_report_path'],
             'test_name': state.get('test_name', 'N/A'),
-            'result': collected_data['test_report']['result'],
-            'total_tests': collected_data['test_report']['total_tests'],
+            'result': collected_data.test_report.result,
+            'total_tests': collected_data.test_report.total_tests,
             'failure_count': failure_details.get('failure_count', 0),
-            'failure_details': str(failure_details.get('test_failures', [])[:5]),
+            'failure_details': failure_summary,
             'error_lines': error_lines,
             'local_exit_code': state.get('local_exit_code'),
             'local_success': state.get('execution_success'),
-            'local_error_count': len(state.get('local_errors', [])),
+            'local_error_count': len(local_error_list),
             'local_errors': local_errors,
-            'xml_failed': collected_data['comparison']['xml_failed'],
-            'local_failed': collected_data['comparison']['local_failed'],
-            'consistent_failure': collected_data['comparison']['consistent_failure'],
-        })
-        
-        analysis_text = response.content
-        
-        # Parse response (simplified)
-        lines = analysis_text.split('\n')
-        root_cause = "See full analysis"
-        confidence = 0.7
-        recommendations = []
-        
-        # Extract sections from response
-        current_section = None
-        for line in lines:
-            line = line.strip()
-            if 'root cause' in line.lower() and ':' in line:
-                current_section = 'root_cause'
-            elif 'confidence' in line.lower() and ':' in line:
-                current_section = 'confidence'
-                try:
-                    conf_str = line.split(':')[1].strip()
-                    confidence = float(conf_str.replace('%', '').strip()) / 100 if '%' in conf_str else float(conf_str)
-                except:
-                    pass
-            elif 'recommendation' in line.lower() and ':' in line:
-                current_section = 'recommendations'
-            elif current_section == 'recommendations' and line.startswith(('-', '•', '*')):
-                recommendations.append(line.lstrip('-•* '))
-        
-        # Use full analysis as root cause
-        root_cause = analysis_text
-        
+            'xml_failed': comparison.xml_failed,
+            'local_failed': comparison.local_failed,
+            'consistent_failure': comparison.consistent_failure,
+        }
+
+        # Get analysis from LLM, via the cache when this exact failure was
+        # already analyzed. Cached entries hold the structured model as JSON.
+        cache_key = _cache_key(llm_config['model'], prompt_vars)
+        analysis = _parse_cached(_cache_get(cache_key))
+
+        # Fall back to similarity matching: failures that differ only by a
+        # timestamp or build number share the same root-cause family
+        semantic_payload = f"{prompt_vars['failure_details']}\n{error_lines}\n{local_errors}"
+        if analysis is None:
+            try:
+                analysis = _parse_cached(_get_semantic_cache().get(semantic_payload))
+            except Exception:
+                analysis = None
+
+        if analysis is None:
+            # Structured output: the model returns RootCauseAnalysis
+            # directly, no free-text section parsing afterwards
+            chain = prompt | llm.with_structured_output(RootCauseAnalysis)
+            # Async invoke so concurrent batch analyses overlap on the
+            # network instead of serializing
+            analysis = await chain.ainvoke(prompt_vars)
+            serialized = analysis.model_dump_json()
+            _cache_set(cache_key, serialized)
+            try:
+                _get_semantic_cache().set(semantic_payload, serialized)
+            except Exception:
+                pass
+        else:
+            print("   💾 Using cached analysis")
+
         print("✅ Root cause analysis completed")
-        print(f"   Confidence: {confidence:.2%}")
-        print(f"   Recommendations: {len(recommendations)}")
-        
+        print(f"   Confidence: {analysis.confidence:.2%}")
+        print(f"   Category: {analysis.category}")
+        print(f"   Recommendations: {len(analysis.recommendations)}")
+
         return {
-            'root_cause': root_cause,
-            'confidence_level': confidence,
-            'recommendations': recommendations if recommendations else ["See detailed analysis for recommendations"],
+            'root_cause': f"{analysis.root_cause}\n\nFailure Category: {analysis.category}",
+            'confidence_level': analysis.confidence,
+            'recommendations': analysis.recommendations or ["See detailed analysis for recommendations"],
             'workflow_status': 'analyzed'
         }
         
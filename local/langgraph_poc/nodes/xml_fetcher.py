@@ -1,31 +1,53 @@
 """Node for fetching test results from XML."""
+import asyncio
+import functools
+import os
 from typing import Dict, Any
 from ..state import FailureAnalysisState
 from ..clients.xml_reader import XMLReportReader
 from ..config import Config
 
 
-def xml_report_fetcher(state: FailureAnalysisState, config: Config) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=32)
+def _read_report(xml_path: str, mtime_ns: int, size: int, max_len: int):
+    """Parse the XML report (blocking; runs in a worker thread).
+
+    Keyed on (path, mtime, size) so node retries and repeated runs in
+    the same process reuse the parse instead of re-walking the XML.
+    Failure strings are truncated here, at the ingestion boundary, so
+    the state carries (and the LLM prompt pays for) bounded text instead
+    of formatters re-truncating full stack traces downstream.
+    """
+    test_results, failure_details = XMLReportReader(xml_path).parse_once()
+    for failure in failure_details['test_failures']:
+        failure['message'] = failure['message'][:max_len]
+        failure['text'] = failure['text'][:max_len]
+    failure_details['error_lines'] = [
+        line[:max_len] for line in failure_details['error_lines']
+    ]
+    return test_results, failure_details
+
+
+async def xml_report_fetcher(state: FailureAnalysisState, config: Config) -> Dict[str, Any]:
     """Fetch test results from XML file.
-    
+
     Args:
         state: Current workflow state
         config: Configuration object
-        
+
     Returns:
         Updated state dictionary
     """
     print("📥 Reading XML test report...")
-    
+
     try:
-        # Initialize XML reader
-        reader = XMLReportReader(state['xml_report_path'])
-        
-        # Parse report
-        test_results = reader.parse_report()
-        
-        # Extract failure details
-        failure_details = reader.extract_failure_details()
+        # Disk read + parse happen in a worker thread so the repo-listing
+        # branch runs concurrently
+        st = os.stat(state['xml_report_path'])
+        test_results, failure_details = await asyncio.to_thread(
+            _read_report, state['xml_report_path'], st.st_mtime_ns, st.st_size,
+            config.get('llm.max_message_len', 500)
+        )
         
         print(f"✅ Successfully parsed XML report")
         print(f"   Total tests: {test_results['total_tests']}")
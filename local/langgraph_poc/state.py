@@ -1,5 +1,59 @@
 """State definitions for the LangGraph workflow."""
+from dataclasses import dataclass
 from typing import TypedDict, Optional, Dict, List, Any
+from typing_extensions import Annotated
+
+
+def last_value(current: Any, new: Any) -> Any:
+    """Reducer for keys written by concurrent branches - latest non-null wins."""
+    return new if new is not None else current
+
+
+# Slotted, frozen structs for the collected results: attribute access is
+# faster than nested dict lookups on the analyzer/report hot paths, and
+# the fixed shape catches typos that dict keys would silently absorb
+
+@dataclass(slots=True, frozen=True)
+class TestReportData:
+    """Summary of the parsed XML test report."""
+    xml_path: str
+    test_name: str
+    result: Optional[str]
+    failure_details: Optional[Dict[str, Any]]
+    total_tests: int
+
+
+@dataclass(slots=True, frozen=True)
+class RepositoryData:
+    """Summary of the analyzed repository."""
+    path: Optional[str]
+    file_count: int
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutionData:
+    """Summary of the local test execution."""
+    success: Optional[bool]
+    exit_code: Optional[int]
+    error_count: int
+    log_length: int
+
+
+@dataclass(slots=True, frozen=True)
+class Comparison:
+    """XML-report vs local-execution consistency flags."""
+    xml_failed: bool
+    local_failed: bool
+    consistent_failure: bool
+
+
+@dataclass(slots=True, frozen=True)
+class CollectedData:
+    """All per-run results gathered by the results collector."""
+    test_report: TestReportData
+    repository: RepositoryData
+    local_execution: ExecutionData
+    comparison: Comparison
 
 
 class FailureAnalysisState(TypedDict):
@@ -19,20 +73,23 @@ class FailureAnalysisState(TypedDict):
     
     # Local execution results
     local_execution_logs: Optional[str]
+    local_log_length: Optional[int]
     local_exit_code: Optional[int]
     local_errors: Optional[List[str]]
     execution_success: Optional[bool]
     
     # Analysis results
-    collected_data: Optional[Dict[str, Any]]
+    collected_data: Optional[CollectedData]
     root_cause: Optional[str]
     confidence_level: Optional[float]
     recommendations: Optional[List[str]]
     
     # Report
+    report_prefix: Optional[str]
     final_report: Optional[str]
     
-    # Metadata
-    workflow_status: str
-    error_message: Optional[str]
+    # Metadata - xml_fetcher and local_repo run in the same superstep, so
+    # these keys need a reducer for concurrent updates
+    workflow_status: Annotated[str, last_value]
+    error_message: Annotated[Optional[str], last_value]
     timestamp: str
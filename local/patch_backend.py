@@ -1,6 +1,4 @@
-﻿import re
-
-print("=== Patching Backend for Training Integration ===\n")
+﻿print("=== Patching Backend for Training Integration ===\n")
 
 # Read current backend
 with open('app_testng_local_repo.py', 'r', encoding='utf-8') as f:
@@ -34,35 +32,36 @@ except Exception as e:
     print(f"⚠️ Could not load AGENT_TRAINING.md: {e}")
 '''
 
-# Insert after the LOCAL_REPO_PATH setup
-lines = content.split('\n')
-new_lines = []
-inserted = False
-
-for i, line in enumerate(lines):
-    new_lines.append(line)
-    # Insert after LOCAL_REPO_PATH = '' (around line 37)
-    if "LOCAL_REPO_PATH = ''" in line and not inserted:
-        new_lines.append(training_loader)
-        inserted = True
-
-content = '\n'.join(new_lines)
+# Insert after the LOCAL_REPO_PATH = '' line (around line 37) - one find
+# plus two slices instead of splitting the whole file into a line list
+# and joining it back
+idx = content.find("LOCAL_REPO_PATH = ''")
+if idx != -1:
+    end = content.find('\n', idx) + 1
+    content = content[:end] + training_loader + '\n' + content[end:]
 print("      ✅ Training loader added")
 
 print("\n[3/3] Updating analyze function to use training...")
 
-# Find the analyze function and add training to prompt
-pattern = r'(def analyze_testng_failure_with_claude\(failure_data\):.*?prompt = f""")'
-replacement = r'''\1
-    
+# Find the analyze function and add training to prompt. Anchored finds
+# instead of a DOTALL regex - the lazy .*? scan is quadratic on a large
+# backend file, while two str.find calls touch each byte once.
+training_patch = r'''
+
     # Add training section to prompt
     training_section = ""
     if TRAINING_CONTENT:
         training_section = TRAINING_CONTENT + "\n\n---\n\nNow apply the 6-step methodology above to this failure:\n\n"
-    
+
     prompt = f"""{training_section}'''
 
-content = re.sub(pattern, replacement, content, flags=re.DOTALL)
+func_start = content.find('def analyze_testng_failure_with_claude(failure_data):')
+if func_start != -1:
+    anchor = 'prompt = f"""'
+    anchor_start = content.find(anchor, func_start)
+    if anchor_start != -1:
+        anchor_end = anchor_start + len(anchor)
+        content = content[:anchor_end] + training_patch + content[anchor_end:]
 
 # Save updated backend
 with open('app_testng_local_repo.py', 'w', encoding='utf-8') as f:
@@ -6,14 +6,33 @@ Run with: python create_complete_poc.py
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Files are queued here and written in one batch at the end of main() -
+# each parent directory gets a single mkdir instead of one stat chain
+# per file, and the writes themselves run in parallel (they're I/O-bound)
+FILES = []
+
 def create_file(filepath, content):
-    """Create a file with the given content."""
-    path = Path(filepath)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding='utf-8')
-    print(f"   ✅ Created {filepath}")
+    """Queue a file for batched creation."""
+    FILES.append((filepath, content))
+
+def write_files(files):
+    """Write all queued files: each parent dir once, writes in parallel."""
+    for parent in {Path(filepath).parent for filepath, _ in files}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    def _write(item):
+        filepath, content = item
+        Path(filepath).write_text(content, encoding='utf-8')
+        return filepath
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # Printing happens here on the main thread, so worker threads
+        # never contend on stdout
+        for filepath in executor.map(_write, files):
+            print(f"   ✅ Created {filepath}")
 
 def main():
     print("🚀 Creating Complete LangGraph POC files (LOCAL VERSION)...")
@@ -1505,9 +1524,12 @@ ValueError: Invalid input
 '''
     
     create_file("tests/sample-test-results.xml", sample_xml)
-    
+
+    # Everything queued - create parent dirs once each and write in parallel
+    write_files(FILES)
+
     # ==================== COMPLETION MESSAGE ====================
-    
+
     print()
     print("=" * 70)
     print("✅ ALL FILES CREATED SUCCESSFULLY!")
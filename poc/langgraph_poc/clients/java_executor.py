@@ -1,8 +1,63 @@
 """Execute Java tests using Maven or Gradle."""
 import subprocess
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+# Retained output is capped per stream - Maven/Gradle runs can emit
+# hundreds of MB and capture_output would buffer all of it in memory
+_MAX_OUTPUT_LINES = 2000
+
+
+def _drain(pipe, buf):
+    """Stream one pipe line-by-line into a bounded buffer."""
+    for line in pipe:
+        buf.append(line)
+    pipe.close()
+
+
+def _run_streamed(command: List[str], cwd: str, timeout: int):
+    """Run a command, keeping only a bounded tail of each stream.
+
+    Two background threads drain stdout/stderr as the process runs, so
+    memory stays constant regardless of how chatty the build is and the
+    child never blocks on a full pipe.
+
+    Args:
+        command: Command and arguments
+        cwd: Working directory
+        timeout: Timeout in seconds
+
+    Returns:
+        Tuple of (exit_code, stdout_tail, stderr_tail)
+    """
+    proc = subprocess.Popen(
+        command,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1
+    )
+    out_buf = deque(maxlen=_MAX_OUTPUT_LINES)
+    err_buf = deque(maxlen=_MAX_OUTPUT_LINES)
+    threads = [
+        threading.Thread(target=_drain, args=(proc.stdout, out_buf), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, err_buf), daemon=True),
+    ]
+    for t in threads:
+        t.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    for t in threads:
+        t.join()
+    return returncode, ''.join(out_buf), ''.join(err_buf)
+
 
 class JavaTestExecutor:
     """Execute Java tests with Maven or Gradle."""
@@ -82,19 +137,13 @@ class JavaTestExecutor:
         command = ['mvn', 'test', f'-Dtest={test_param}', '-DfailIfNoTests=false']
         
         try:
-            result = subprocess.run(
-                command,
-                cwd=str(self.repo_path),
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            
+            returncode, stdout, stderr = _run_streamed(command, str(self.repo_path), timeout)
+
             return {
-                'success': result. returncode == 0,
-                'output': result.stdout,
-                'errors': [result.stderr] if result.stderr else [],
-                'exit_code': result.returncode,
+                'success': returncode == 0,
+                'output': stdout,
+                'errors': [stderr] if stderr else [],
+                'exit_code': returncode,
                 'command': ' '.join(command)
             }
         except subprocess.TimeoutExpired:
@@ -154,19 +203,13 @@ class JavaTestExecutor:
             }
         
         try:
-            result = subprocess.run(
-                command,
-                cwd=str(self.repo_path),
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            
+            returncode, stdout, stderr = _run_streamed(command, str(self.repo_path), timeout)
+
             return {
-                'success': result.returncode == 0,
-                'output': result.stdout,
-                'errors': [result. stderr] if result.stderr else [],
-                'exit_code': result.returncode,
+                'success': returncode == 0,
+                'output': stdout,
+                'errors': [stderr] if stderr else [],
+                'exit_code': returncode,
                 'command': ' '.join(command)
             }
         except subprocess.TimeoutExpired:
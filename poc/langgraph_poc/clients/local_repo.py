@@ -1,7 +1,12 @@
 """Local repository handler."""
+import os
 from typing import List, Optional
 from pathlib import Path
 
+# Directory names pruned during repo walks - frozen at module level so
+# the membership test never rebuilds the set
+_IGNORE = frozenset({'.git', '__pycache__', 'node_modules', '.venv', 'venv'})
+
 
 class LocalRepoClient:
     """Client for accessing local repository."""
@@ -35,17 +40,26 @@ class LocalRepoClient:
         Returns:
             List of relative file paths
         """
+        # os.scandir descent instead of rglob: ignored directories are
+        # pruned before being entered (rglob would materialize a Path for
+        # every entry under .git/node_modules and discard it afterwards),
+        # and entries stay plain strings until the final relpath
+        ext_set = frozenset(extensions) if extensions is not None else None
+        root = str(self.repo_path)
         files = []
-        
-        for file_path in self.repo_path.rglob('*'):
-            if file_path.is_file():
-                # Skip common ignore patterns
-                if any(ignore in file_path.parts for ignore in ['.git', '__pycache__', 'node_modules', '.venv', 'venv']):
-                    continue
-                    
-                if extensions is None or file_path.suffix in extensions:
-                    files.append(str(file_path.relative_to(self.repo_path)))
-        
+        stack = [root]
+
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _IGNORE:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        if ext_set is None or os.path.splitext(entry.name)[1] in ext_set:
+                            files.append(os.path.relpath(entry.path, root))
+
         return sorted(files)
     
     def get_file_content(self, relative_path: str) -> str:
@@ -5,78 +5,138 @@ from typing import Dict, List, Any, Optional
 import re
 
 
+def _classify_failures(failures, loose_assert=False):
+    """Compute the error-type flags in one pass over the failures.
+
+    The three any() scans each walked the whole failure list and
+    re-lowered every message; one pass with early exit computes all
+    flags together.
+
+    Args:
+        failures: List of failure-info dictionaries
+        loose_assert: Also accept bare 'Assert' in the error type
+            (TestNG convention)
+
+    Returns:
+        Tuple of (has_compilation_error, has_timeout, has_assertion_error)
+    """
+    has_compilation = has_timeout = has_assert = False
+    for failure in failures:
+        error_type = failure.get('error_type', '')
+        if not has_compilation and 'CompilationError' in error_type:
+            has_compilation = True
+        if not has_timeout and 'timeout' in failure.get('error_message', '').lower():
+            has_timeout = True
+        if not has_assert and ('AssertionError' in error_type
+                               or (loose_assert and 'Assert' in error_type)):
+            has_assert = True
+        if has_compilation and has_timeout and has_assert:
+            break
+    return has_compilation, has_timeout, has_assert
+
+
 class XMLReportReader:
     """Read and parse XML test reports in JUnit or TestNG format."""
     
     def __init__(self, xml_path: str):
-        """Initialize the XML reader. 
-        
+        """Initialize the XML reader.
+
         Args:
             xml_path: Path to the XML test report file
         """
         self.xml_path = Path(xml_path)
-        self.tree = None
-        self.root = None
         self.format = None  # 'junit' or 'testng'
-        
+        self._report = None  # memoized parse_report result
+
         if not self.xml_path.exists():
             raise FileNotFoundError(f"XML file not found: {xml_path}")
-        
+
         try:
-            self.tree = ET.parse(self.xml_path)
-            self.root = self.tree.getroot()
             self._detect_format()
         except ET. ParseError as e:
             raise ValueError(f"Invalid XML file: {e}")
-    
+
+    def _iterparse(self, events):
+        """iterparse over a 1MB-buffered handle.
+
+        The default 8KB buffering means ~128x more read() syscalls on the
+        multi-hundred-MB reports CI produces.
+        """
+        with open(self.xml_path, 'rb', buffering=1 << 20) as f:
+            for item in ET.iterparse(f, events=events):
+                yield item
+
     def _detect_format(self):
-        """Detect if the XML is JUnit or TestNG format."""
-        if self.root. tag == 'testng-results':
-            self.format = 'testng'
-        elif self.root.tag == 'testsuites' or self.root.tag == 'testsuite':
-            self. format = 'junit'
-        else:
-            # Try to detect by looking for child elements
-            if self.root.find('. //test-method') is not None:
-                self. format = 'testng'
-            elif self.root.find('.//testcase') is not None:
+        """Detect if the XML is JUnit or TestNG format.
+
+        Streams just enough of the file to identify it - the root tag is
+        usually decisive, so this normally reads one element instead of
+        building the whole DOM.
+        """
+        root_tag = None
+        for event, elem in self._iterparse(events=('start',)):
+            if root_tag is None:
+                root_tag = elem.tag
+                if root_tag == 'testng-results':
+                    self.format = 'testng'
+                    return
+                elif root_tag == 'testsuites' or root_tag == 'testsuite':
+                    self.format = 'junit'
+                    return
+            # Unrecognized root: keep scanning for a telltale child element
+            if elem.tag == 'test-method':
+                self.format = 'testng'
+                return
+            elif elem.tag == 'testcase':
                 self.format = 'junit'
-            else:
-                raise ValueError(f"Unknown XML format.  Root tag: {self.root.tag}")
+                return
+        raise ValueError(f"Unknown XML format.  Root tag: {root_tag}")
     
     def parse_report(self) -> Dict[str, Any]:
         """Parse the test report and extract summary statistics.
-        
+
+        The result is memoized - extract_failure_details needs the totals
+        too, so back-to-back calls would otherwise re-read and re-parse
+        the same file.
+
         Returns:
             Dictionary with test statistics
         """
-        if self.format == 'testng':
-            return self._parse_testng()
-        else:
-            return self._parse_junit()
+        if self._report is None:
+            if self.format == 'testng':
+                self._report = self._parse_testng()
+            else:
+                self._report = self._parse_junit()
+        return self._report
     
     def _parse_testng(self) -> Dict[str, Any]:
-        """Parse TestNG format XML. 
-        
+        """Parse TestNG format XML (single streaming pass).
+
         Returns:
             Dictionary with test statistics
         """
-        # Get summary from root attributes
-        total = int(self.root.get('total', 0))
-        passed = int(self.root.get('passed', 0))
-        failed = int(self.root. get('failed', 0))
-        skipped = int(self.root. get('skipped', 0))
-        ignored = int(self.root.get('ignored', 0))
-        
-        # Calculate duration
+        total = passed = failed = skipped = ignored = 0
         duration = 0.0
-        for suite in self.root.findall('. //suite'):
-            suite_duration = suite.get('duration-ms', '0')
-            try:
-                duration += float(suite_duration) / 1000.0  # Convert ms to seconds
-            except (ValueError, TypeError):
-                pass
-        
+
+        # Summary lives on the root's attributes (available at its start
+        # event); suite durations accumulate as each suite closes, and
+        # clearing the closed suite keeps memory bounded
+        for event, elem in self._iterparse(events=('start', 'end')):
+            if event == 'start':
+                if elem.tag == 'testng-results':
+                    total = int(elem.get('total', 0))
+                    passed = int(elem.get('passed', 0))
+                    failed = int(elem.get('failed', 0))
+                    skipped = int(elem.get('skipped', 0))
+                    ignored = int(elem.get('ignored', 0))
+            elif elem.tag == 'suite':
+                suite_duration = elem.get('duration-ms', '0')
+                try:
+                    duration += float(suite_duration) / 1000.0  # Convert ms to seconds
+                except (ValueError, TypeError):
+                    pass
+                elem.clear()
+
         return {
             'total_tests': total,
             'passed_tests': passed,
@@ -88,8 +148,8 @@ class XMLReportReader:
         }
     
     def _parse_junit(self) -> Dict[str, Any]:
-        """Parse JUnit format XML.
-        
+        """Parse JUnit format XML (single streaming pass).
+
         Returns:
             Dictionary with test statistics
         """
@@ -99,28 +159,30 @@ class XMLReportReader:
         error_tests = 0
         skipped_tests = 0
         duration = 0.0
-        
-        # Find all test suites
-        testsuites = self.root.findall('.//testsuite')
-        if not testsuites and self.root.tag == 'testsuite':
-            testsuites = [self.root]
-        
-        for suite in testsuites:
+
+        # Every testsuite (including a root-level one) surfaces as an
+        # end event, so the attribute accumulation is a linear pass with
+        # each closed suite freed immediately
+        for event, suite in self._iterparse(events=('end',)):
+            if suite.tag != 'testsuite':
+                continue
+
             tests = int(suite.get('tests', 0))
             failures = int(suite.get('failures', 0))
             errors = int(suite.get('errors', 0))
             skipped = int(suite.get('skipped', 0))
             time = float(suite.get('time', 0))
-            
+
             total_tests += tests
             failed_tests += failures
             error_tests += errors
             skipped_tests += skipped
             duration += time
-            
+
             # Count passed tests (total - failures - errors - skipped)
             passed_tests += (tests - failures - errors - skipped)
-        
+            suite.clear()
+
         return {
             'total_tests': total_tests,
             'passed_tests': passed_tests,
@@ -150,9 +212,21 @@ class XMLReportReader:
         """
         failures = []
         error_lines = []
-        
-        # Find all test methods with status="FAIL"
-        for test_method in self. root.findall('.//test-method[@status="FAIL"]'):
+        total = 0
+
+        # One streaming pass: each test-method subtree is complete at its
+        # end event, gets mined for failure details, then freed
+        for event, test_method in self._iterparse(events=('start', 'end')):
+            if event == 'start':
+                if test_method.tag == 'testng-results':
+                    total = int(test_method.get('total', 0))
+                continue
+            if test_method.tag != 'test-method':
+                continue
+            if test_method.get('status') != 'FAIL':
+                test_method.clear()
+                continue
+
             method_name = test_method.get('name', 'Unknown')
             signature = test_method.get('signature', '')
             duration_ms = test_method.get('duration-ms', '0')
@@ -227,11 +301,12 @@ class XMLReportReader:
                 for line in stack_lines:
                     if line.strip():
                         error_lines.append(f"  {line. strip()}")
-        
+
+            test_method.clear()
+
         # Determine overall result
         failed_count = len(failures)
-        total = int(self.root. get('total', 0))
-        
+
         if failed_count == 0:
             result = 'SUCCESS'
         elif failed_count == total:
@@ -240,9 +315,7 @@ class XMLReportReader:
             result = 'PARTIAL_FAILURE'
         
         # Check for specific error types
-        has_compilation_error = any('CompilationError' in f. get('error_type', '') for f in failures)
-        has_timeout = any('timeout' in f.get('error_message', '').lower() for f in failures)
-        has_assertion_error = any('AssertionError' in f.get('error_type', '') or 'Assert' in f.get('error_type', '') for f in failures)
+        has_compilation_error, has_timeout, has_assertion_error = _classify_failures(failures, loose_assert=True)
         
         return {
             'failure_count': failed_count,
@@ -263,13 +336,25 @@ class XMLReportReader:
         """
         failures = []
         error_lines = []
-        
-        # Find all testcases
-        for testcase in self.root.findall('.//testcase'):
-            # Check for failure
-            failure = testcase.find('failure')
-            error = testcase.find('error')
-            
+
+        # One streaming pass: each testcase is complete at its end event,
+        # gets checked for failure/error children, then freed
+        for event, testcase in self._iterparse(events=('end',)):
+            if testcase.tag != 'testcase':
+                if testcase.tag == 'testsuite':
+                    testcase.clear()
+                continue
+
+            # Check for failure - one pass over the children instead of
+            # a separate linear find() scan per tag
+            failure = error = None
+            for child in testcase:
+                tag = child.tag
+                if tag == 'failure' and failure is None:
+                    failure = child
+                elif tag == 'error' and error is None:
+                    error = child
+
             if failure is not None or error is not None:
                 elem = failure if failure is not None else error
                 
@@ -295,7 +380,9 @@ class XMLReportReader:
                 if stack_trace:
                     stack_lines = stack_trace.split('\n')[:5]
                     error_lines.extend(stack_lines)
-        
+
+            testcase.clear()
+
         # Determine overall result
         failed_count = len(failures)
         test_results = self.parse_report()
@@ -309,9 +396,7 @@ class XMLReportReader:
             result = 'PARTIAL_FAILURE'
         
         # Check for specific error types
-        has_compilation_error = any('CompilationError' in f.get('error_type', '') for f in failures)
-        has_timeout = any('timeout' in f.get('error_message', '').lower() for f in failures)
-        has_assertion_error = any('AssertionError' in f.get('error_type', '') for f in failures)
+        has_compilation_error, has_timeout, has_assertion_error = _classify_failures(failures)
         
         return {
             'failure_count': failed_count,
@@ -383,8 +468,8 @@ class XMLReportReader:
             merged['result'] = 'PARTIAL_FAILURE'
         
         # Check for specific error types
-        merged['has_compilation_error'] = any('CompilationError' in f.get('error_type', '') for f in merged['test_failures'])
-        merged['has_timeout'] = any('timeout' in f.get('error_message', '').lower() for f in merged['test_failures'])
-        merged['has_assertion_error'] = any('AssertionError' in f.get('error_type', '') or 'Assert' in f.get('error_type', '') for f in merged['test_failures'])
+        (merged['has_compilation_error'],
+         merged['has_timeout'],
+         merged['has_assertion_error']) = _classify_failures(merged['test_failures'], loose_assert=True)
         
         return merged
\ No newline at end of file
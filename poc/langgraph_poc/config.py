@@ -1,10 +1,16 @@
 """Configuration management for the POC."""
 import os
+import types
 import yaml
-from pathlib import Path
 from typing import Dict, Any
 from dotenv import load_dotenv
 
+try:
+    # C-accelerated loader parses ~10x faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class Config:
     """Configuration manager."""
@@ -13,37 +19,45 @@ class Config:
         load_dotenv()
         self.config_path = config_path
         self._config = self._load_config()
-        
+        # Dotted keys are resolved once here; get() is then a single
+        # dict lookup instead of a split + nested walk per call
+        self._flat = types.MappingProxyType(dict(self._flatten(self._config)))
+
+    @staticmethod
+    def _flatten(config: Dict[str, Any], prefix: str = ''):
+        """Yield ('a.b.c', value) pairs for every leaf (and subtree)."""
+        for key, value in config.items():
+            dotted = f"{prefix}{key}"
+            yield dotted, value
+            if isinstance(value, dict):
+                yield from Config._flatten(value, f"{dotted}.")
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
-        if not Path(self.config_path).exists():
+        # Open directly instead of an exists() pre-check: one stat
+        # syscall instead of two, and no check-then-open race
+        try:
+            with open(self.config_path, 'rb') as f:
+                config = yaml.load(f, Loader=_YamlLoader)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
-            
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        
+
         # Load AWS credentials from environment
         os.environ['AWS_ACCESS_KEY_ID'] = os.getenv('AWS_ACCESS_KEY_ID', '')
         os.environ['AWS_SECRET_ACCESS_KEY'] = os.getenv('AWS_SECRET_ACCESS_KEY', '')
         os.environ['AWS_SESSION_TOKEN'] = os.getenv('AWS_SESSION_TOKEN', '')
         os.environ['AWS_REGION'] = os.getenv('AWS_REGION', 'us-east-1')
-        
+
         # Override with environment variables
-        config['llm']['region'] = os.getenv('AWS_REGION', config['llm'].get('region', 'us-east-1'))
-        config['llm']['model'] = os.getenv('LLM_MODEL', config['llm'].get('model'))
-        
+        llm = config['llm']
+        llm['region'] = os.getenv('AWS_REGION', llm.get('region', 'us-east-1'))
+        llm['model'] = os.getenv('LLM_MODEL', llm.get('model'))
+
         return config
     
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value by key."""
-        keys = key.split('.')
-        value = self._config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k, default)
-            else:
-                return default
-        return value
+        """Get configuration value by dotted key (single flat lookup)."""
+        return self._flat.get(key, default)
     
     @property
     def llm(self) -> Dict[str, Any]:
@@ -1,4 +1,5 @@
 """LangGraph workflow definition."""
+import asyncio
 from langgraph.graph import StateGraph, END
 from typing import Dict, Any
 from . state import FailureAnalysisState
@@ -22,24 +23,38 @@ def create_failure_analysis_graph(config: Config) -> StateGraph:
     """
     # Create graph
     workflow = StateGraph(FailureAnalysisState)
-    
+
+    # The XML parse and the repository walk only consume the initial
+    # state, so they run in the same superstep; both are async with the
+    # blocking I/O pushed to worker threads
+    async def _fetch_xml(state: FailureAnalysisState) -> Dict[str, Any]:
+        return await xml_report_fetcher(state, config)
+
+    async def _access_repo(state: FailureAnalysisState) -> Dict[str, Any]:
+        return await local_repo_access(state, config)
+
+    async def _analyze_root_cause(state: FailureAnalysisState) -> Dict[str, Any]:
+        return await root_cause_analyzer(state, config)
+
     # Add nodes
-    workflow.add_node("fetch_xml", lambda state: xml_report_fetcher(state, config))
-    workflow.add_node("access_repo", lambda state: local_repo_access(state, config))
+    workflow.add_node("start", lambda state: None)
+    workflow.add_node("fetch_xml", _fetch_xml)
+    workflow.add_node("access_repo", _access_repo)
     workflow.add_node("execute_local", lambda state: local_executor(state, config))
     workflow.add_node("collect_results", lambda state: results_collector(state, config))
-    workflow.add_node("analyze_root_cause", lambda state: root_cause_analyzer(state, config))
+    workflow.add_node("analyze_root_cause", _analyze_root_cause)
     workflow.add_node("generate_report", lambda state: report_generator(state, config))
-    
-    # Define edges
-    workflow.set_entry_point("fetch_xml")
-    workflow.add_edge("fetch_xml", "access_repo")
-    workflow.add_edge("access_repo", "execute_local")
+
+    # Define edges: fan out from start, barrier before local execution
+    workflow.set_entry_point("start")
+    workflow.add_edge("start", "fetch_xml")
+    workflow.add_edge("start", "access_repo")
+    workflow.add_edge(["fetch_xml", "access_repo"], "execute_local")
     workflow.add_edge("execute_local", "collect_results")
     workflow. add_edge("collect_results", "analyze_root_cause")
     workflow.add_edge("analyze_root_cause", "generate_report")
     workflow.add_edge("generate_report", END)
-    
+
     return workflow. compile()
 
 
@@ -113,7 +128,7 @@ def run_failure_analysis(
     print(f"   Test Name: {test_name or 'N/A'}")
     print()
     
-    # Execute workflow
-    final_state = graph.invoke(initial_state)
-    
+    # Execute workflow (async so the input nodes overlap)
+    final_state = asyncio.run(graph.ainvoke(initial_state))
+
     return final_state
\ No newline at end of file
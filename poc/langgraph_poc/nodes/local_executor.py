@@ -17,11 +17,20 @@ def local_executor(state: FailureAnalysisState, config: Config) -> Dict[str, Any
     Returns:
         Updated state dictionary
     """
+    # Upstream error: skip the work entirely - the linear chain carries
+    # the error state through without a conditional-edge dispatch.
+    # Gate on error_message, not workflow_status: the fan-out branches
+    # both write workflow_status in the same superstep, so a successful
+    # branch can overwrite a sibling's 'error' through the last_value
+    # reducer, while error_message is only ever written on failure
+    if state.get('error_message'):
+        return {}
+
     debug_logger = state.get('_debug_logger')
-    
+
     if debug_logger:
         debug_logger.stage_start("Local Executor")
-    
+
     print("🔧 Executing tests locally...")
     
     # Get repository path
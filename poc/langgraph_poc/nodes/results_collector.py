@@ -14,6 +14,12 @@ def results_collector(state: FailureAnalysisState, config: Config) -> Dict[str,
     Returns:
         Updated state dictionary
     """
+    # Upstream error: nothing to collect, pass the state through
+    # (error_message rather than workflow_status - a successful fan-out
+    # sibling can overwrite the status in the same superstep)
+    if state.get('error_message'):
+        return {}
+
     debug_logger = state.get('_debug_logger')
     
     if debug_logger:
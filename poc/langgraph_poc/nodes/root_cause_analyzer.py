@@ -1,4 +1,5 @@
 ﻿"""Node for analyzing root cause using LLM."""
+import functools
 from typing import Dict, Any
 from langchain_aws import ChatBedrock
 from langchain_core.prompts import ChatPromptTemplate
@@ -6,16 +7,42 @@ from ..  state import FailureAnalysisState
 from ..config import Config
 
 
-def root_cause_analyzer(state: FailureAnalysisState, config: Config) -> Dict[str, Any]:
-    """Analyze root cause of failure using LLM.  
-    
+@functools.lru_cache(maxsize=8)
+def _get_llm(model_id: str, region: str, temperature: float, max_tokens: int) -> ChatBedrock:
+    """Build (and reuse) the Bedrock client for a given config.
+
+    Constructing ChatBedrock per node call pays boto3 session/client
+    setup and a fresh connection pool every time; the cached instance
+    keeps its keep-alive connections across graph runs, which is what
+    batch analysis of many failing runs hits repeatedly.
+    """
+    return ChatBedrock(
+        model_id=model_id,
+        region_name=region,
+        credentials_profile_name=None,
+        model_kwargs={
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+    )
+
+
+async def root_cause_analyzer(state: FailureAnalysisState, config: Config) -> Dict[str, Any]:
+    """Analyze root cause of failure using LLM.
+
     Args:
         state: Current workflow state
         config: Configuration object
-        
+
     Returns:
         Updated state dictionary
     """
+    # Upstream error: skip the LLM call, pass the state through
+    # (error_message rather than workflow_status - a successful fan-out
+    # sibling can overwrite the status in the same superstep)
+    if state.get('error_message'):
+        return {}
+
     debug_logger = state.get('_debug_logger')
     
     if debug_logger:
@@ -35,15 +62,13 @@ def root_cause_analyzer(state: FailureAnalysisState, config: Config) -> Dict[str
                 "Temperature": llm_config.get('temperature', 0.3)
             })
         
-        # Initialize LLM
-        llm = ChatBedrock(
-            model_id=llm_config['model'],
-            region_name=llm_config.get('region', 'us-east-1'),
-            credentials_profile_name=None,
-            model_kwargs={
-                "temperature": llm_config.get('temperature', 0.3),
-                "max_tokens": llm_config.get('max_tokens', 2000)
-            }
+        # Initialize LLM (cached - reuses the client and its connection
+        # pool across invocations)
+        llm = _get_llm(
+            llm_config['model'],
+            llm_config.get('region', 'us-east-1'),
+            llm_config.get('temperature', 0.3),
+            llm_config.get('max_tokens', 2000)
         )
         
         if debug_logger:
@@ -163,15 +188,20 @@ Please analyze this information and provide the root cause, confidence level, an
             except Exception as e:
                 debug_logger.log_detail("Prompt Format Error", str(e))
         
-        # Get analysis from LLM
+        # Get analysis from LLM. Streaming instead of a blocking invoke:
+        # tokens accumulate as they arrive (joined once at the end), so
+        # the event loop stays free for other graph work and a full
+        # response buffer isn't held twice
         chain = prompt | llm
-        
+
         if debug_logger:
             debug_logger.log_detail("Sending to LLM", "In progress...")
-        
-        response = chain.invoke(prompt_vars)
-        
-        analysis_text = response.  content
+
+        chunks = []
+        async for chunk in chain.astream(prompt_vars):
+            chunks.append(chunk.content)
+
+        analysis_text = ''.join(chunks)
         
         # Log the response
         if debug_logger:
@@ -1,17 +1,27 @@
 """Node for fetching test results from XML."""
+import asyncio
 from typing import Dict, Any
 from .. state import FailureAnalysisState
 from ..clients.xml_reader import XMLReportReader
 from ..config import Config
 
 
-def xml_report_fetcher(state: FailureAnalysisState, config: Config) -> Dict[str, Any]:
-    """Fetch test results from XML file(s).  
-    
+def _parse_single(xml_path: str):
+    """Blocking parse of one report (runs in a worker thread)."""
+    reader = XMLReportReader(xml_path)
+    return reader.parse_report(), reader. extract_failure_details()
+
+
+async def xml_report_fetcher(state: FailureAnalysisState, config: Config) -> Dict[str, Any]:
+    """Fetch test results from XML file(s).
+
+    Async so the parse overlaps the repository walk; only the keys this
+    node owns are returned, letting LangGraph merge concurrent branches.
+
     Args:
         state: Current workflow state
         config: Configuration object
-        
+
     Returns:
         Updated state dictionary
     """
@@ -25,7 +35,6 @@ def xml_report_fetcher(state: FailureAnalysisState, config: Config) -> Dict[str,
     if not xml_paths:
         print("ERROR: No XML paths found in state")
         return {
-            **state,
             'workflow_status': 'error',
             'error_message': 'No XML paths provided'
         }
@@ -39,10 +48,8 @@ def xml_report_fetcher(state: FailureAnalysisState, config: Config) -> Dict[str,
             debug_logger.log_detail("File Path", xml_paths[0])
         
         try:
-            reader = XMLReportReader(xml_paths[0])
-            test_results = reader.parse_report()
-            failure_details = reader. extract_failure_details()
-            
+            test_results, failure_details = await asyncio.to_thread(_parse_single, xml_paths[0])
+
             if debug_logger:
                 debug_logger.log_data("Test Results", {
                     "Total Tests": test_results['total_tests'],
@@ -67,7 +74,6 @@ def xml_report_fetcher(state: FailureAnalysisState, config: Config) -> Dict[str,
                 debug_logger.stage_end("XML Report Fetcher", "SUCCESS")
             
             return {
-                **state,
                 'test_results': test_results,
                 'failure_details': failure_details,
                 'workflow_status': 'xml_fetched'
@@ -76,10 +82,9 @@ def xml_report_fetcher(state: FailureAnalysisState, config: Config) -> Dict[str,
             if debug_logger:
                 debug_logger.log_error(e, "XML Report Fetcher")
                 debug_logger.stage_end("XML Report Fetcher", "ERROR")
-            
+
             print(f"Failed to read XML report: {str(e)}")
             return {
-                **state,
                 'workflow_status': 'error',
                 'error_message': f"XML parsing failed: {str(e)}"
             }
@@ -91,8 +96,8 @@ def xml_report_fetcher(state: FailureAnalysisState, config: Config) -> Dict[str,
         
         try:
             # Merge all reports
-            merged_results = XMLReportReader.merge_reports(xml_paths)
-            
+            merged_results = await asyncio.to_thread(XMLReportReader.merge_reports, xml_paths)
+
             if debug_logger:
                 debug_logger.log_data("Merged Test Results", {
                     "Total Tests": merged_results['total_tests'],
@@ -111,7 +116,6 @@ def xml_report_fetcher(state: FailureAnalysisState, config: Config) -> Dict[str,
                 debug_logger.stage_end("XML Report Fetcher", "SUCCESS")
             
             return {
-                **state,
                 'test_results': merged_results,
                 'failure_details': merged_results,
                 'workflow_status': 'xml_fetched'
@@ -120,10 +124,9 @@ def xml_report_fetcher(state: FailureAnalysisState, config: Config) -> Dict[str,
             if debug_logger:
                 debug_logger.log_error(e, "XML Report Fetcher (Multiple Files)")
                 debug_logger. stage_end("XML Report Fetcher", "ERROR")
-            
+
             print(f"Failed to read XML reports: {str(e)}")
             return {
-                **state,
                 'workflow_status': 'error',
                 'error_message': f"XML parsing failed: {str(e)}"
             }
\ No newline at end of file
@@ -4,6 +4,11 @@ from langgraph.graph import add_messages
 from typing_extensions import Annotated
 
 
+def last_value(current, new):
+    """Reducer for keys that several concurrent branches may write."""
+    return new if new is not None else current
+
+
 class FailureAnalysisState(TypedDict, total=False):
     """State for failure analysis workflow."""
     
@@ -41,9 +46,10 @@ class FailureAnalysisState(TypedDict, total=False):
     # Final report
     final_report: Optional[str]
     
-    # Workflow metadata
-    workflow_status: Optional[str]
-    error_message: Optional[str]
+    # Workflow metadata - the input nodes run concurrently, so these
+    # keys can receive multiple writes in one superstep
+    workflow_status: Annotated[Optional[str], last_value]
+    error_message: Annotated[Optional[str], last_value]
     
     # Internal
     _debug_logger: Optional[Any]
\ No newline at end of file